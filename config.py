@@ -1,10 +1,8 @@
 """Game configuration and balance settings."""
 
-from dataclasses import dataclass
-from typing import Dict
-import logging
-
-logger = logging.getLogger(__name__)
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+import sys
 
 # Initial state
 STARTING_COINS = 100
@@ -21,9 +19,7 @@ GROWTH_UPDATE_INTERVAL = 1  # seconds
 OFFLINE_REWARD_MULTIPLIER = 0.7  # 70% value
 MAX_OFFLINE_TIME = 86400  # 24 hours
 
-# UI Timing (delays for focus restoration, etc.)
-MODAL_CLOSE_DELAY = 0.05  # seconds
-PLOT_FOCUS_DELAY = 0.1  # seconds
+# UI Timing
 MODAL_ANIMATION_DELAY = 0.3  # seconds
 
 # UI Messages
@@ -32,19 +28,23 @@ MIN_OFFLINE_TIME_FOR_MODAL = 300  # Show modal for offline > 5 min
 MIN_OFFLINE_TIME_TO_PROCESS = 10  # Process offline progression > 10 sec
 
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CropConfig:
-    """Configuration for a single crop type."""
+    """Configuration for a single crop type (immutable)."""
     name: str
     emoji: str
     growth_time: int  # seconds
     seed_cost: int
     sell_price: int
     unlock_level: int
+    profit: int = field(init=False)  # precomputed: sell_price - seed_cost
 
-    @property
-    def profit(self) -> int:
-        return self.sell_price - self.seed_cost
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'profit', self.sell_price - self.seed_cost)
 
 
 # Crop balance
@@ -57,6 +57,13 @@ CROPS = {
     'PUMPKIN': CropConfig('Pumpkin', '🎃', 600, 150, 400, 7),
 }
 
+# Precomputed views of CROPS (built once at import, CROPS never changes)
+CROPS_ITEMS: Tuple[Tuple[str, CropConfig], ...] = tuple(CROPS.items())
+CROPS_BY_UNLOCK_LEVEL: Dict[int, List[Tuple[str, CropConfig]]] = {}
+for _crop_type, _config in CROPS_ITEMS:
+    CROPS_BY_UNLOCK_LEVEL.setdefault(_config.unlock_level, []).append((_crop_type, _config))
+del _crop_type, _config
+
 # Growth stage emojis
 STAGE_EMOJIS = {
     'EMPTY': '⬛',
@@ -72,64 +79,3 @@ import os
 SAVE_DIR = os.path.expanduser('~/.farmgame')
 SAVE_FILE = os.path.join(SAVE_DIR, 'savegame.json')
 
-
-def validate_config() -> bool:
-    """
-    Validate game configuration for errors.
-
-    Returns:
-        True if configuration is valid, False otherwise
-    """
-    is_valid = True
-
-    # Validate CROPS
-    if not CROPS:
-        logger.error("CROPS configuration is empty")
-        return False
-
-    for crop_key, config in CROPS.items():
-        # Check for negative or zero values
-        if config.growth_time <= 0:
-            logger.error(f"Crop '{crop_key}' has invalid growth_time: {config.growth_time}")
-            is_valid = False
-
-        if config.seed_cost < 0:
-            logger.error(f"Crop '{crop_key}' has negative seed_cost: {config.seed_cost}")
-            is_valid = False
-
-        if config.sell_price < 0:
-            logger.error(f"Crop '{crop_key}' has negative sell_price: {config.sell_price}")
-            is_valid = False
-
-        if config.unlock_level < 1:
-            logger.error(f"Crop '{crop_key}' has invalid unlock_level: {config.unlock_level}")
-            is_valid = False
-
-        # Check for unprofitable crops
-        if config.profit < 0:
-            logger.warning(f"Crop '{crop_key}' is unprofitable (profit: {config.profit})")
-
-    # Validate progression settings
-    if XP_PER_LEVEL <= 0:
-        logger.error(f"XP_PER_LEVEL must be positive: {XP_PER_LEVEL}")
-        is_valid = False
-
-    if XP_PER_HARVEST <= 0:
-        logger.error(f"XP_PER_HARVEST must be positive: {XP_PER_HARVEST}")
-        is_valid = False
-
-    # Validate timing
-    if AUTO_SAVE_INTERVAL <= 0:
-        logger.error(f"AUTO_SAVE_INTERVAL must be positive: {AUTO_SAVE_INTERVAL}")
-        is_valid = False
-
-    if OFFLINE_REWARD_MULTIPLIER < 0 or OFFLINE_REWARD_MULTIPLIER > 1:
-        logger.error(f"OFFLINE_REWARD_MULTIPLIER must be between 0 and 1: {OFFLINE_REWARD_MULTIPLIER}")
-        is_valid = False
-
-    if is_valid:
-        logger.info("Configuration validated successfully")
-    else:
-        logger.error("Configuration validation failed")
-
-    return is_valid
@@ -1,35 +1,59 @@
 #!/usr/bin/env python3
 """TUI Farming Game - Main application."""
 
-import asyncio
 import logging
-from typing import Optional, Callable, Tuple
+import time
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple
 from textual.app import App, ComposeResult
-from textual.containers import Container, Vertical, Horizontal, VerticalScroll
+from textual.containers import Container, Vertical
 from textual.widgets import Static, Button, Header, Footer
+from textual.widget import AwaitRemove
 from textual.reactive import reactive
 from textual.binding import Binding
 from textual import work
-from textual.css.query import NoMatches
-
-from models.farm import Farm
-from models.player import Player
-from systems.save_system import SaveSystem
-from widgets.farm_grid import FarmGrid
-from widgets.sidebar import Sidebar
-from widgets.plot import PlotClicked
+
 from config import (
-    AUTO_SAVE_INTERVAL, GROWTH_UPDATE_INTERVAL, CROPS,
-    XP_PER_HARVEST, MODAL_CLOSE_DELAY, PLOT_FOCUS_DELAY,
-    MODAL_ANIMATION_DELAY, MIN_OFFLINE_TIME_FOR_TOAST,
+    AUTO_SAVE_INTERVAL, GROWTH_UPDATE_INTERVAL, CROPS, CROPS_ITEMS,
+    CROPS_BY_UNLOCK_LEVEL, XP_PER_HARVEST, MIN_OFFLINE_TIME_FOR_TOAST,
     MIN_OFFLINE_TIME_FOR_MODAL
 )
 
+# Game modules are imported lazily where first used to keep startup cheap
+if TYPE_CHECKING:
+    from models.farm import Farm
+    from models.player import Player
+    from widgets.farm_grid import FarmGrid
+    from widgets.sidebar import Sidebar
+    from widgets.plot import PlotClicked
+
 logger = logging.getLogger(__name__)
 
+# Help text depends only on static config, so build it once
+_HELP_TEXT = (
+    "[bold]TUI Farm Game Help[/bold]\n\n"
+    "[bold]Keyboard Controls:[/bold]\n"
+    "hjkl or Arrow Keys: Navigate plots\n"
+    "Enter/Space: Interact with plot\n"
+    "q: Quit | ?: Help | s: Shop\n\n"
+    "[bold]Gameplay:[/bold]\n"
+    "🌱 Plant crops on empty plots\n"
+    "✨ Harvest ready crops (green border)\n"
+    "💰 Earn coins by harvesting\n"
+    "⭐ Gain XP to level up and unlock new crops\n\n"
+    "[bold]Crops:[/bold]\n"
+) + "".join(
+    f"{config.emoji} {config.name}: {config.growth_time}s, {config.seed_cost}💰 → {config.sell_price}💰 ({config.profit} profit)\n"
+    for _, config in CROPS_ITEMS
+)
+
 
 class SeedSelector(Container):
-    """Modal for selecting seeds to plant."""
+    """
+    Modal for selecting seeds to plant.
+
+    Mounted once and reused: open() rebinds the callbacks and refreshes
+    option state in place, and the app hides it instead of removing it.
+    """
 
     BINDINGS = [
         Binding("escape", "cancel", "Cancel", priority=True, show=False),
@@ -41,43 +65,81 @@ class SeedSelector(Container):
         Binding("shift+tab", "focus_previous", "Previous", priority=True, show=False),
     ]
 
-    def __init__(self, player: Player, on_select, on_cancel):
+    def __init__(self, player: 'Player', on_select, on_cancel):
         super().__init__(id="seed-selector")
         self.player = player
         self.on_select = on_select
         self.on_cancel = on_cancel
+        self._seed_buttons: Dict[str, Button] = {}  # Every crop, built in compose
+        self._cancel_button: Optional[Button] = None
+        self._buttons: List[Button] = []  # Focusable buttons, rebuilt by refresh_options
 
     def compose(self) -> ComposeResult:
         """Create seed selector content."""
         yield Static("🌱 Select Seed to Plant", id="seed-selector-title")
 
+        # One button per crop; locked crops are disabled by refresh_options
         with Vertical(id="seed-list"):
-            for crop_type, config in CROPS.items():
-                if config.unlock_level > self.player.level:
-                    # Locked crop
-                    yield Static(
-                        f"[dim]{config.emoji} {config.name} - 🔒 Level {config.unlock_level}[/dim]",
-                        classes="seed-option seed-option-locked"
-                    )
-                else:
-                    can_afford = self.player.coins >= config.seed_cost
-                    color = "green" if can_afford else "red"
-                    yield Button(
-                        f"{config.emoji} {config.name} - {config.seed_cost}💰 ({config.growth_time}s)",
-                        id=f"seed-{crop_type}",
-                        classes="seed-option"
-                    )
-
-        yield Button("Cancel", id="seed-cancel", variant="error")
+            for crop_type, config in CROPS_ITEMS:
+                button = Button(
+                    f"{config.emoji} {config.name} - {config.seed_cost}💰 ({config.growth_time}s)",
+                    id=f"seed-{crop_type}",
+                    classes="seed-option"
+                )
+                self._seed_buttons[crop_type] = button
+                yield button
+
+        self._cancel_button = Button("Cancel", id="seed-cancel", variant="error")
+        yield self._cancel_button
+
+    def refresh_options(self) -> None:
+        """Update lock and affordability state of every option in place."""
+        buttons = []
+        seed_buttons = self._seed_buttons
+        level = self.player.level
+        coins = self.player.coins
+        for crop_type, config in CROPS_ITEMS:
+            button = seed_buttons[crop_type]
+            locked = config.unlock_level > level
+            if locked:
+                button.label = f"{config.emoji} {config.name} - 🔒 Level {config.unlock_level}"
+            else:
+                button.label = f"{config.emoji} {config.name} - {config.seed_cost}💰 ({config.growth_time}s)"
+                buttons.append(button)
+            button.disabled = locked
+            button.set_class(locked, "seed-option-locked")
+            button.set_class(
+                not locked and coins < config.seed_cost,
+                "seed-option-unaffordable"
+            )
+
+        if self._cancel_button is not None:
+            buttons.append(self._cancel_button)
+        self._buttons = buttons
+
+    def open(self, on_select, on_cancel) -> None:
+        """
+        Show the selector again for a new plot.
+
+        Args:
+            on_select: Called with the chosen crop type
+            on_cancel: Called when the selector is dismissed
+        """
+        self.on_select = on_select
+        self.on_cancel = on_cancel
+        self.refresh_options()
+        self.display = True
+        if self._buttons:
+            self._buttons[0].focus()
 
     async def on_mount(self) -> None:
         """Focus first button when mounted."""
         # Prevent focus from going to elements behind the modal
         self.can_focus = True
-        # Focus the first button
-        buttons = self.query("Button")
-        if buttons:
-            buttons.first().focus()
+        # Buttons are cached so navigation doesn't walk the DOM per keypress
+        self.refresh_options()
+        if self._buttons:
+            self._buttons[0].focus()
 
     def action_cancel(self) -> None:
         """Handle cancel action."""
@@ -85,34 +147,28 @@ class SeedSelector(Container):
 
     def action_focus_previous(self) -> None:
         """Focus previous button, cycling within modal."""
-        buttons = list(self.query("Button"))
-        if not buttons:
-            return
-
-        # Find currently focused button
-        focused = self.screen.focused
-        if focused in buttons:
-            current_idx = buttons.index(focused)
-            # Cycle to previous (or wrap to last)
-            prev_idx = (current_idx - 1) % len(buttons)
-            buttons[prev_idx].focus()
-        else:
-            # No button focused, focus first
-            buttons[0].focus()
+        self._cycle_focus(-1)
 
     def action_focus_next(self) -> None:
         """Focus next button, cycling within modal."""
-        buttons = list(self.query("Button"))
+        self._cycle_focus(1)
+
+    def _cycle_focus(self, step: int) -> None:
+        """
+        Move focus by step buttons, wrapping around.
+
+        Args:
+            step: -1 for previous, 1 for next
+        """
+        buttons = self._buttons
         if not buttons:
             return
 
-        # Find currently focused button
+        # Find currently focused button (may have moved via mouse)
         focused = self.screen.focused
         if focused in buttons:
             current_idx = buttons.index(focused)
-            # Cycle to next (or wrap to first)
-            next_idx = (current_idx + 1) % len(buttons)
-            buttons[next_idx].focus()
+            buttons[(current_idx + step) % len(buttons)].focus()
         else:
             # No button focused, focus first
             buttons[0].focus()
@@ -212,16 +268,22 @@ class FarmGame(App):
 
     def __init__(self) -> None:
         super().__init__()
-        self.farm: Optional[Farm] = None
-        self.player: Optional[Player] = None
-        self.farm_grid: Optional[FarmGrid] = None
-        self.sidebar: Optional[Sidebar] = None
+        self.farm: Optional['Farm'] = None
+        self.player: Optional['Player'] = None
+        self.farm_grid: Optional['FarmGrid'] = None
+        self.sidebar: Optional['Sidebar'] = None
         self._save_worker = None
         self._update_worker = None
         self.focused_plot: Tuple[int, int] = (0, 0)  # Track focused plot coordinates
+        # Modals, tracked directly instead of querying the DOM.
+        # The seed selector is created once and hidden between uses.
+        self._seed_selector: Optional[SeedSelector] = None
+        self._offline_summary: Optional[OfflineSummary] = None
 
     def compose(self) -> ComposeResult:
         """Create main layout."""
+        from widgets.sidebar import Sidebar
+
         yield Header()
 
         with Container(id="main-container"):
@@ -233,6 +295,10 @@ class FarmGame(App):
 
     async def on_mount(self) -> None:
         """Initialize game on mount."""
+        from systems.save_system import SaveSystem
+        from widgets.farm_grid import FarmGrid
+        from widgets.sidebar import Sidebar
+
         # Load or create game
         save_data = SaveSystem.load_game()
 
@@ -261,8 +327,8 @@ class FarmGame(App):
         # Update UI
         await self._refresh_ui()
 
-        # Set initial focus to first plot (with small delay to ensure plots are ready)
-        self.set_timer(PLOT_FOCUS_DELAY, lambda: self._set_plot_focus(0, 0))
+        # Set initial focus to first plot once the plots have rendered
+        self.call_after_refresh(self._set_plot_focus, 0, 0)
 
         # Start background workers
         self._start_workers()
@@ -274,12 +340,27 @@ class FarmGame(App):
 
     def _auto_save(self) -> None:
         """Auto-save game every 30 seconds."""
+        from systems.save_system import SaveSystem
+
         if self.farm and self.player:
-            SaveSystem.save_game(self.farm, self.player)
-            self.notify("💾 Auto-saved", timeout=2)
+            # Snapshot on the UI thread, write to disk in the background
+            seq, data = SaveSystem.serialize(self.farm, self.player)
+            self._write_save(seq, data)
+
+    @work(thread=True, group="save")
+    def _write_save(self, seq: int, data: bytes) -> None:
+        """Write serialized save data without blocking the UI."""
+        from systems.save_system import SaveSystem
+
+        # Dropped if the quit save (or a later auto-save) got there first
+        if SaveSystem.write_bytes(seq, data):
+            self.call_from_thread(self.notify, "💾 Auto-saved", timeout=2)
 
     def _growth_update(self) -> None:
         """Update crop growth every second."""
+        if self.farm and not self.farm.has_active_crops:
+            return  # Nothing can change until the player plants or harvests
+
         if self.farm_grid:
             self.farm_grid.update_all_plots()
             self._update_sidebar_sync()
@@ -290,46 +371,45 @@ class FarmGame(App):
             self.farm_grid.update_all_plots()
         await self._update_sidebar()
 
+    async def _refresh_plot(self, x: int, y: int) -> None:
+        """Refresh one changed plot and the sidebar, not the whole grid."""
+        if self.farm_grid:
+            self.farm_grid.update_plot(x, y)
+        await self._update_sidebar()
+
     async def _update_sidebar(self) -> None:
         """Update sidebar stats."""
         if self.sidebar and self.player and self.farm:
-            ready_count = len(self.farm.get_ready_crops())
-            self.sidebar.update_from_player(self.player, ready_count)
+            self.sidebar.update_from_player(self.player, self.farm.ready_count)
 
     def _update_sidebar_sync(self) -> None:
         """Synchronous version of _update_sidebar for thread workers."""
         if self.sidebar and self.player and self.farm:
-            ready_count = len(self.farm.get_ready_crops())
-            self.sidebar.update_from_player(self.player, ready_count)
+            self.sidebar.update_from_player(self.player, self.farm.ready_count)
 
     def _set_plot_focus(self, x: int, y: int) -> None:
         """Set focus to a specific plot."""
         if not self.farm_grid:
             return
 
-        plot = self.farm_grid.plots.get((x, y))
+        plot = self.farm_grid.get_plot(x, y)
         if plot:
             self.focused_plot = (x, y)
             plot.focus()
 
     def _restore_plot_focus(self, x: int, y: int) -> None:
         """Restore focus to a plot after modal closes."""
-        self.set_timer(MODAL_CLOSE_DELAY, lambda: self._set_plot_focus(x, y))
+        self.call_after_refresh(self._set_plot_focus, x, y)
 
-    async def _remove_modal_if_exists(self, modal_id: str) -> None:
-        """
-        Remove a modal if it exists.
+    def _close_seed_selector(self) -> None:
+        """Hide the seed selector if open (it is kept mounted for reuse)."""
+        if self._seed_selector is not None:
+            self._seed_selector.display = False
 
-        Args:
-            modal_id: ID of the modal to remove
-        """
-        try:
-            existing = self.query_one(f"#{modal_id}")
-            await existing.remove()
-        except NoMatches:
-            pass  # Modal doesn't exist, continue
-        except Exception as e:
-            logger.error(f"Error removing modal {modal_id}: {e}")
+    def _close_offline_summary(self) -> Optional[AwaitRemove]:
+        """Remove the offline summary if open. Await the result to wait for removal."""
+        summary, self._offline_summary = self._offline_summary, None
+        return summary.remove() if summary is not None else None
 
     def action_focus_left(self) -> None:
         """Move focus left."""
@@ -361,26 +441,15 @@ class FarmGame(App):
 
     def action_cancel(self) -> None:
         """Cancel/close modals."""
-        # Try to close seed selector if open
-        try:
-            selector = self.query_one("#seed-selector")
-            selector.remove()
-        except NoMatches:
-            pass  # Modal not open, ignore
-        except Exception as e:
-            logger.error(f"Error closing seed selector: {e}")
-
-        # Try to close offline summary if open
-        try:
-            summary = self.query_one("#offline-summary")
-            summary.remove()
-        except NoMatches:
-            pass  # Modal not open, ignore
-        except Exception as e:
-            logger.error(f"Error closing offline summary: {e}")
-
-    async def on_plot_clicked(self, message: PlotClicked) -> None:
+        self._close_seed_selector()
+        self._close_offline_summary()
+
+    async def on_plot_clicked(self, message: 'PlotClicked') -> None:
         """Handle plot click."""
+        if message.crop is not None:
+            # The tick snapshot can be up to a second old; decide on the live clock
+            message.crop.update(time.time())
+
         if message.crop is None:
             # Empty plot - show seed selector
             await self._show_seed_selector(message.x, message.y)
@@ -392,26 +461,26 @@ class FarmGame(App):
             crop = message.crop
             time_left = crop.time_remaining
             self.notify(
-                f"🌱 {crop.config.name} growing... {time_left} remaining",
+                f"🌱 {crop.name} growing... {time_left} remaining",
                 timeout=2
             )
 
     async def _show_seed_selector(self, x: int, y: int) -> None:
         """Show seed selection modal."""
-        # Remove existing selector if present
-        await self._remove_modal_if_exists("seed-selector")
-
         def on_select(crop_type: str) -> None:
             self.app.call_later(self._plant_crop, x, y, crop_type)
-            selector.remove()
+            self._close_seed_selector()
             self._restore_plot_focus(x, y)
 
         def on_cancel() -> None:
-            selector.remove()
+            self._close_seed_selector()
             self._restore_plot_focus(x, y)
 
-        selector = SeedSelector(self.player, on_select, on_cancel)
-        await self.mount(selector)
+        if self._seed_selector is None:
+            self._seed_selector = SeedSelector(self.player, on_select, on_cancel)
+            await self.mount(self._seed_selector)
+        else:
+            self._seed_selector.open(on_select, on_cancel)
 
     async def _plant_crop(self, x: int, y: int, crop_type: str) -> None:
         """Plant a crop at the given position."""
@@ -426,7 +495,7 @@ class FarmGame(App):
         if self.farm.plant_crop(x, y, crop_type):
             self.player.total_crops_planted += 1
             self.notify(f"🌱 Planted {config.name}!", severity="information")
-            await self._refresh_ui()
+            await self._refresh_plot(x, y)
         else:
             # Refund if planting failed
             self.player.add_coins(config.seed_cost)
@@ -447,7 +516,7 @@ class FarmGame(App):
 
         # Notifications
         self.notify(
-            f"✨ Harvested {crop.config.emoji}! +{crop.config.sell_price}💰 +{XP_PER_HARVEST}✨",
+            f"✨ Harvested {crop.emoji}! +{crop.config.sell_price}💰 +{XP_PER_HARVEST}✨",
             severity="information"
         )
 
@@ -455,21 +524,20 @@ class FarmGame(App):
         if levels_gained > 0:
             await self._handle_level_up(levels_gained)
 
-        await self._refresh_ui()
+        await self._refresh_plot(x, y)
 
     async def _handle_level_up(self, levels_gained: int) -> None:
         """Handle level up rewards."""
         for _ in range(levels_gained):
-            # Check for crop unlocks
-            for crop_type, config in CROPS.items():
-                if config.unlock_level == self.player.level:
-                    self.player.unlock_crop(crop_type)
-                    self.notify(
-                        f"🎉 Level {self.player.level}! {config.name} unlocked!",
-                        severity="information",
-                        timeout=5
-                    )
-                    return
+            # Check for crop unlocks (only crops unlocking at this level)
+            for crop_type, config in CROPS_BY_UNLOCK_LEVEL.get(self.player.level, ()):
+                self.player.unlock_crop(crop_type)
+                self.notify(
+                    f"🎉 Level {self.player.level}! {config.name} unlocked!",
+                    severity="information",
+                    timeout=5
+                )
+                return
 
             # Generic level up
             self.notify(
@@ -481,15 +549,17 @@ class FarmGame(App):
     async def _show_offline_summary(self, summary: dict) -> None:
         """Show offline progression summary modal."""
         # Remove existing modal if present
-        await self._remove_modal_if_exists("offline-summary")
+        removal = self._close_offline_summary()
+        if removal is not None:
+            await removal
 
         def on_close() -> None:
-            modal.remove()
+            self._close_offline_summary()
             x, y = self.focused_plot
             self._restore_plot_focus(x, y)
 
-        modal = OfflineSummary(summary, on_close)
-        await self.mount(modal)
+        self._offline_summary = OfflineSummary(summary, on_close)
+        await self.mount(self._offline_summary)
 
     def action_shop(self) -> None:
         """Open shop (placeholder)."""
@@ -497,28 +567,12 @@ class FarmGame(App):
 
     def action_help(self) -> None:
         """Show help."""
-        help_text = (
-            "[bold]TUI Farm Game Help[/bold]\n\n"
-            "[bold]Keyboard Controls:[/bold]\n"
-            "hjkl or Arrow Keys: Navigate plots\n"
-            "Enter/Space: Interact with plot\n"
-            "q: Quit | ?: Help | s: Shop\n\n"
-            "[bold]Gameplay:[/bold]\n"
-            "🌱 Plant crops on empty plots\n"
-            "✨ Harvest ready crops (green border)\n"
-            "💰 Earn coins by harvesting\n"
-            "⭐ Gain XP to level up and unlock new crops\n\n"
-            "[bold]Crops:[/bold]\n"
-        )
-
-        for crop_type, config in CROPS.items():
-            profit = config.profit
-            help_text += f"{config.emoji} {config.name}: {config.growth_time}s, {config.seed_cost}💰 → {config.sell_price}💰 ({profit} profit)\n"
-
-        self.notify(help_text, timeout=10)
+        self.notify(_HELP_TEXT, timeout=10)
 
     async def on_unmount(self) -> None:
         """Save game on exit."""
+        from systems.save_system import SaveSystem
+
         if self.farm and self.player:
             SaveSystem.save_game(self.farm, self.player)
 
@@ -550,12 +604,6 @@ def main() -> None:
     """Entry point."""
     setup_logging()
 
-    # Validate configuration before starting
-    from config import validate_config
-    if not validate_config():
-        logger.error("Configuration validation failed. Please fix config.py")
-        return
-
     app = FarmGame()
     app.run()
 
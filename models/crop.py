@@ -1,25 +1,65 @@
 """Crop system implementation."""
 
-from enum import Enum
-from typing import Optional, Dict, Any
+from enum import IntEnum
+import functools
+import sys
+from typing import Optional, Dict, Any, Sequence, Tuple, TextIO
 import time
 
 from config import CROPS, STAGE_EMOJIS, CropConfig
 
 
-class GrowthStage(Enum):
-    """Visual growth stages for crops."""
-    EMPTY = "EMPTY"
-    PLANTED = "PLANTED"
-    SPROUTING = "SPROUTING"
-    GROWING = "GROWING"
-    FLOWERING = "FLOWERING"
-    READY = "READY"
+class GrowthStage(IntEnum):
+    """Visual growth stages for crops (ints, usable as tuple indices)."""
+    EMPTY = 0
+    PLANTED = 1
+    SPROUTING = 2
+    GROWING = 3
+    FLOWERING = 4
+    READY = 5
+
+
+# Stage emojis indexed by GrowthStage, built once from config
+STAGE_EMOJI_BY_IDX = tuple(STAGE_EMOJIS[stage.name] for stage in GrowthStage)
+
+# Stages indexed by min(4, int(progress * 5)) while growing (80-100% stays
+# FLOWERING); index 5 is READY
+_STAGE_TUPLE = (
+    GrowthStage.PLANTED,
+    GrowthStage.SPROUTING,
+    GrowthStage.GROWING,
+    GrowthStage.FLOWERING,
+    GrowthStage.FLOWERING,  # Almost ready
+    GrowthStage.READY,
+)
+
+# Every possible 8-character progress bar, indexed by filled cells (0-8)
+_PROGRESS_BARS = tuple("█" * i + "░" * (8 - i) for i in range(9))
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_remaining(remaining_seconds: int) -> str:
+    """Format whole seconds as "30s", "2m 15s", "1h 5m" (memoized)."""
+    if remaining_seconds < 60:
+        return f"{remaining_seconds}s"
+    elif remaining_seconds < 3600:
+        minutes = remaining_seconds // 60
+        seconds = remaining_seconds % 60
+        return f"{minutes}m {seconds}s" if seconds > 0 else f"{minutes}m"
+    else:
+        hours = remaining_seconds // 3600
+        minutes = (remaining_seconds % 3600) // 60
+        return f"{hours}h {minutes}m" if minutes > 0 else f"{hours}h"
 
 
 class Crop:
     """Represents a single growing crop."""
 
+    __slots__ = (
+        'crop_type', 'config', 'emoji', 'name', '_planted_at', '_ready_at', '_inv_growth',
+        '_cached_progress', '_cached_ready', '_cached_stage',
+    )
+
     def __init__(self, crop_type: str, planted_at: Optional[float] = None) -> None:
         """
         Initialize a crop.
@@ -35,15 +75,71 @@ class Crop:
         if crop_type not in CROPS:
             raise ValueError(f"Unknown crop type: {crop_type}")
 
-        self.crop_type = crop_type
+        self.crop_type = sys.intern(crop_type)  # Loaded saves carry fresh copies
         self.config: CropConfig = CROPS[crop_type]
+        # Copied from config for the render path
+        self.emoji = self.config.emoji
+        self.name = self.config.name
+        self._inv_growth = 1.0 / self.config.growth_time  # multiply instead of divide
 
         # Validate planted_at timestamp
         plant_time = planted_at if planted_at is not None else time.time()
         if plant_time < 0:
             raise ValueError(f"Invalid planted_at timestamp: {plant_time}")
 
-        self.planted_at = plant_time
+        self.planted_at = plant_time  # Also sets ready_at and clears the snapshot
+
+    @property
+    def planted_at(self) -> float:
+        """Unix timestamp when the crop was planted."""
+        return self._planted_at
+
+    @planted_at.setter
+    def planted_at(self, value: float) -> None:
+        self._planted_at = value
+        self._ready_at = value + self.config.growth_time
+        # Growth snapshot taken by update(); None means "read the clock live"
+        self._cached_progress: Optional[float] = None
+        self._cached_ready: Optional[bool] = None
+        self._cached_stage: Optional[GrowthStage] = None
+
+    @property
+    def ready_at(self) -> float:
+        """Unix timestamp when the crop becomes ready (precomputed)."""
+        return self._ready_at
+
+    def _progress(self, now: float) -> float:
+        """Calculate growth progress at the given timestamp."""
+        progress = (now - self._planted_at) * self._inv_growth
+        return max(0.0, progress)  # Don't return negative
+
+    def snapshot(self, now: float) -> Tuple[float, GrowthStage, bool]:
+        """
+        Compute growth state at a single point in time.
+
+        Args:
+            now: Unix timestamp to evaluate at
+
+        Returns:
+            Tuple of (growth_progress, current_stage, is_ready)
+        """
+        progress = self._progress(now)
+        ready = now >= self._ready_at
+        # READY is decided by ready_at so stage and is_ready always agree
+        stage = _STAGE_TUPLE[5 if ready else min(4, int(progress * 5))]
+        return progress, stage, ready
+
+    def update(self, now: float) -> None:
+        """
+        Snapshot growth state at a single point in time.
+
+        Called once per UI tick so every property read while rendering
+        shares one clock sample instead of calling time.time() each time.
+
+        Args:
+            now: Unix timestamp of the current tick
+        """
+        self._cached_progress, self._cached_stage, self._cached_ready = self.snapshot(now)
 
     @property
     def growth_progress(self) -> float:
@@ -53,14 +149,16 @@ class Crop:
         Returns:
             Float between 0.0 (just planted) and 1.0+ (ready)
         """
-        elapsed = time.time() - self.planted_at
-        progress = elapsed / self.config.growth_time
-        return max(0.0, progress)  # Don't return negative
+        if self._cached_progress is not None:
+            return self._cached_progress
+        return self._progress(time.time())
 
     @property
     def is_ready(self) -> bool:
         """Check if crop is ready to harvest."""
-        return self.growth_progress >= 1.0
+        if self._cached_ready is not None:
+            return self._cached_ready
+        return time.time() >= self._ready_at
 
     @property
     def current_stage(self) -> GrowthStage:
@@ -70,21 +168,9 @@ class Crop:
         Returns:
             GrowthStage enum value
         """
-        if self.is_ready:
-            return GrowthStage.READY
-
-        progress = self.growth_progress
-
-        if progress < 0.2:
-            return GrowthStage.PLANTED
-        elif progress < 0.4:
-            return GrowthStage.SPROUTING
-        elif progress < 0.6:
-            return GrowthStage.GROWING
-        elif progress < 0.8:
-            return GrowthStage.FLOWERING
-        else:
-            return GrowthStage.FLOWERING  # Almost ready
+        if self._cached_stage is not None:
+            return self._cached_stage
+        return self.snapshot(time.time())[1]
 
     @property
     def time_remaining(self) -> str:
@@ -98,22 +184,12 @@ class Crop:
             return "Ready!"
 
         remaining_seconds = int(self.config.growth_time * (1.0 - self.growth_progress))
-
-        if remaining_seconds < 60:
-            return f"{remaining_seconds}s"
-        elif remaining_seconds < 3600:
-            minutes = remaining_seconds // 60
-            seconds = remaining_seconds % 60
-            return f"{minutes}m {seconds}s" if seconds > 0 else f"{minutes}m"
-        else:
-            hours = remaining_seconds // 3600
-            minutes = (remaining_seconds % 3600) // 60
-            return f"{hours}h {minutes}m" if minutes > 0 else f"{hours}h"
+        return _format_remaining(remaining_seconds)
 
     @property
     def stage_emoji(self) -> str:
         """Get emoji for current growth stage."""
-        return STAGE_EMOJIS[self.current_stage.value]
+        return STAGE_EMOJI_BY_IDX[self.current_stage]
 
     @property
     def progress_bar(self) -> str:
@@ -124,21 +200,34 @@ class Crop:
             String like "████░░░░" showing growth progress
         """
         if self.is_ready:
-            return "████████"
+            return _PROGRESS_BARS[8]
 
-        filled = int(self.growth_progress * 8)
-        return "█" * filled + "░" * (8 - filled)
+        return _PROGRESS_BARS[int(self.growth_progress * 8)]
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize crop to dictionary for saving."""
-        return {
-            'crop_type': self.crop_type,
-            'planted_at': self.planted_at,
-        }
+    def to_tuple(self) -> Tuple[str, float]:
+        """Serialize crop to a compact (crop_type, planted_at) pair for saving."""
+        return (self.crop_type, self.planted_at)
+
+    def write_json(self, fp: TextIO) -> None:
+        """
+        Write the to_tuple() pair straight to a text stream as JSON.
+
+        Crop types are validated config keys, so they need no escaping.
+
+        Args:
+            fp: Writable text stream
+        """
+        fp.write(f'["{self.crop_type}",{self.planted_at!r}]')
+
+    @classmethod
+    def from_tuple(cls, data: Sequence[Any]) -> 'Crop':
+        """Deserialize crop from a (crop_type, planted_at) pair."""
+        crop_type, planted_at = data
+        return cls(crop_type=crop_type, planted_at=planted_at)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Crop':
-        """Deserialize crop from dictionary."""
+        """Deserialize crop from the dictionary form used by version 1 saves."""
         return cls(
             crop_type=data['crop_type'],
             planted_at=data['planted_at']
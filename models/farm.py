@@ -1,28 +1,59 @@
 """Farm state management."""
 
-from typing import Optional, Dict, Tuple, List, Any
+import time
+from typing import Optional, Dict, Tuple, List, Set, Any, TextIO
 from models.crop import Crop
 
 
 class Farm:
-    """Manages the farm grid and crops."""
+    """
+    Manages the farm grid and crops.
+
+    Plots are stored row-major in a flat list: (x, y) lives at index
+    y * width + x.
+    """
+
+    __slots__ = (
+        'width', 'height', 'plots', '_pending', '_settled', '_now', '_dirty', '_changed',
+    )
 
     def __init__(self, width: int = 4, height: int = 4):
         """
         Initialize farm.
 
+        Args:
+            width: Grid width
+            height: Grid height
+        """
+        self.reset(width, height)
+
+    def reset(self, width: int, height: int) -> None:
+        """
+        Clear every plot and resize the grid, reusing this Farm object.
+
         Args:
             width: Grid width
             height: Grid height
         """
         self.width = width
         self.height = height
-        self.plots: Dict[Tuple[int, int], Optional[Crop]] = {}
+        self.plots: List[Optional[Crop]] = [None] * (width * height)
+        # Every occupied plot is in exactly one of these two sets
+        self._pending: Set[int] = set()  # Growing as of the last tick(), or new
+        self._settled: Set[int] = set()  # Ready as of the last tick()
+        self._now: Optional[float] = None  # Timestamp of the last tick()
+        # Display bookkeeping for get_active_plot_coords()
+        self._dirty: Set[int] = set()  # Planted/harvested since last drained
+        self._changed: List[int] = []  # Plots that may have changed last tick
 
-        # Initialize empty plots
-        for x in range(width):
-            for y in range(height):
-                self.plots[(x, y)] = None
+    @property
+    def _occupied(self) -> Set[int]:
+        """Indices of non-empty plots."""
+        return self._pending | self._settled
+
+    def _idx(self, x: int, y: int) -> int:
+        """Flat list index of plot (x, y)."""
+        return y * self.width + x
 
     def plant_crop(self, x: int, y: int, crop_type: str) -> bool:
         """
@@ -39,10 +70,13 @@ class Farm:
         if not self._is_valid_position(x, y):
             return False
 
-        if self.plots[(x, y)] is not None:
+        idx = self._idx(x, y)
+        if self.plots[idx] is not None:
             return False  # Plot already occupied
 
-        self.plots[(x, y)] = Crop(crop_type)
+        self.plots[idx] = Crop(crop_type)
+        self._pending.add(idx)
+        self._dirty.add(idx)
         return True
 
     def harvest_crop(self, x: int, y: int) -> Optional[Crop]:
@@ -59,12 +93,16 @@ class Farm:
         if not self._is_valid_position(x, y):
             return None
 
-        crop = self.plots[(x, y)]
+        idx = self._idx(x, y)
+        crop = self.plots[idx]
         if crop is None:
             return None
 
         # Clear the plot
-        self.plots[(x, y)] = None
+        self.plots[idx] = None
+        self._pending.discard(idx)
+        self._settled.discard(idx)
+        self._dirty.add(idx)
         return crop
 
     def get_crop(self, x: int, y: int) -> Optional[Crop]:
@@ -80,20 +118,106 @@ class Farm:
         """
         if not self._is_valid_position(x, y):
             return None
-        return self.plots.get((x, y))
+        return self.plots[self._idx(x, y)]
 
-    def get_ready_crops(self) -> List[Tuple[int, int, Crop]]:
+    def get_ready_crops(self, now: Optional[float] = None) -> List[Tuple[int, int, Crop]]:
         """
         Get all crops that are ready to harvest.
 
+        Args:
+            now: Unix timestamp to test against (defaults to the last
+                tick(), or the clock if the farm has never ticked)
+
         Returns:
             List of (x, y, crop) tuples
         """
-        ready = []
-        for (x, y), crop in self.plots.items():
-            if crop is not None and crop.is_ready:
-                ready.append((x, y, crop))
-        return ready
+        if now is None:
+            now = self._now if self._now is not None else time.time()
+        plots = self.plots
+        width = self.width
+        return [(idx % width, idx // width, plots[idx]) for idx in self.ripe_indices(now)]
+
+    def ripe_indices(self, now: float) -> List[int]:
+        """
+        Find plots whose crop has finished growing by the given time.
+
+        A pure filter pass with no side effects, so callers can pay out
+        and clear only the plots it returns.
+
+        Args:
+            now: Unix timestamp to test against
+
+        Returns:
+            Sorted flat plot indices of ripe crops
+        """
+        plots = self.plots
+        ripe = [idx for idx in self._settled if plots[idx].ready_at <= now]
+        ripe.extend(idx for idx in self._pending if plots[idx].ready_at <= now)
+        ripe.sort()
+        return ripe
+
+    @property
+    def ready_count(self) -> int:
+        """Number of ready crops as of the last tick (O(1))."""
+        return len(self._settled)
+
+    @property
+    def has_active_crops(self) -> bool:
+        """Whether any crop may still change state on the next tick."""
+        return bool(self._pending)
+
+    def get_active_plot_coords(self) -> List[Tuple[int, int]]:
+        """
+        Get plots whose display may have changed since the previous call.
+
+        That is every crop still growing at the last tick(), crops that
+        ripened on it, and plots planted or harvested since the previous
+        call. Idle plots (empty, or ready and already reported) are left
+        out, so a UI refresh can skip them.
+
+        Returns:
+            Sorted list of (x, y) coordinates
+        """
+        indices = self._dirty.union(self._changed)
+        self._dirty.clear()
+        self._changed = []
+        width = self.width
+        return [(idx % width, idx // width) for idx in sorted(indices)]
+
+    def tick(self, now: float) -> None:
+        """
+        Advance all crops to a single timestamp.
+
+        Only growing crops are snapshotted. Once a crop is seen ready it
+        moves from the pending set to the settled set, and its snapshot
+        stays READY until it is harvested; settled crops cost just a
+        ready_at comparison, which moves any re-timed to ripen later back
+        to pending. Afterwards the settled set is exactly the plots
+        ripe_indices(now) reports, and the plots that may have changed on
+        screen are recorded.
+
+        Args:
+            now: Unix timestamp of the current tick
+        """
+        plots = self.plots
+        pending = self._pending
+        settled = self._settled
+        self._now = now
+        unripened = [idx for idx in settled if plots[idx].ready_at > now]
+        if unripened:
+            settled.difference_update(unripened)
+            pending.update(unripened)
+        changed = []
+        ripened = []
+        for idx in pending:
+            crop = plots[idx]
+            crop.update(now)
+            if crop.is_ready:
+                ripened.append(idx)
+            changed.append(idx)
+        settled.update(ripened)
+        pending.difference_update(ripened)
+        self._changed = changed
 
     def expand(self, new_width: int, new_height: int) -> bool:
         """
@@ -109,11 +233,26 @@ class Farm:
         if new_width < self.width or new_height < self.height:
             return False  # Can't shrink
 
-        # Add new empty plots
-        for x in range(new_width):
-            for y in range(new_height):
-                if (x, y) not in self.plots:
-                    self.plots[(x, y)] = None
+        old_width = self.width
+        if new_width == old_width:
+            # Row-major: new rows append at the end, existing indices are unchanged
+            self.plots.extend([None] * (new_width * (new_height - self.height)))
+        else:
+            # Copy each old row into the wider layout with slice assignment
+            plots: List[Optional[Crop]] = [None] * (new_width * new_height)
+            for y in range(self.height):
+                start = y * new_width
+                plots[start:start + old_width] = self.plots[y * old_width:(y + 1) * old_width]
+            self.plots = plots
+            # Indices moved; treat every crop as pending until the next tick()
+            self._pending = {
+                (idx // old_width) * new_width + idx % old_width
+                for idx in self._occupied
+            }
+            self._settled = set()
+            # Display bookkeeping is index-based too; report everything again
+            self._dirty = set(self._pending)
+            self._changed = []
 
         self.width = new_width
         self.height = new_height
@@ -124,25 +263,75 @@ class Farm:
         return 0 <= x < self.width and 0 <= y < self.height
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize farm to dictionary for saving."""
+        """
+        Serialize farm to dictionary for saving.
+
+        Plots are a list of [x, y, crop] triples for occupied plots only,
+        where crop is the Crop.to_tuple() pair.
+        """
+        width = self.width
+        plots = self.plots
         return {
-            'width': self.width,
+            'width': width,
             'height': self.height,
-            'plots': {
-                f"{x},{y}": crop.to_dict() if crop else None
-                for (x, y), crop in self.plots.items()
-            }
+            'plots': [
+                (idx % width, idx // width, plots[idx].to_tuple())
+                for idx in sorted(self._occupied)
+            ]
         }
 
+    def write_json(self, fp: TextIO) -> None:
+        """
+        Stream the farm to a text stream as JSON in a single pass.
+
+        Produces the same JSON as to_dict() without building it.
+
+        Args:
+            fp: Writable text stream
+        """
+        width = self.width
+        plots = self.plots
+        fp.write(f'{{"width":{width},"height":{self.height},"plots":[')
+        separator = ''
+        for idx in sorted(self._occupied):
+            fp.write(f'{separator}[{idx % width},{idx // width},')
+            plots[idx].write_json(fp)
+            fp.write(']')
+            separator = ','
+        fp.write(']}')
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Farm':
         """Deserialize farm from dictionary."""
         farm = cls(width=data['width'], height=data['height'])
 
+        plots = data['plots']
+        if isinstance(plots, dict):
+            entries = cls._legacy_plot_entries(plots)
+        else:
+            entries = plots
+
         # Restore crops
-        for coord_str, crop_data in data['plots'].items():
-            x, y = map(int, coord_str.split(','))
-            if crop_data is not None:
-                farm.plots[(x, y)] = Crop.from_dict(crop_data)
+        for x, y, crop_data in entries:
+            if not farm._is_valid_position(x, y):
+                continue
+            if isinstance(crop_data, dict):
+                crop = Crop.from_dict(crop_data)  # Version 1 save
+            else:
+                crop = Crop.from_tuple(crop_data)
+            idx = farm._idx(x, y)
+            farm.plots[idx] = crop
+            farm._pending.add(idx)  # Classified by the first tick()
 
         return farm
+
+    @staticmethod
+    def _legacy_plot_entries(plots: Dict[str, Any]) -> List[Tuple[int, int, Any]]:
+        """Convert version 1/2 {"x,y": crop} plots to [x, y, crop] triples."""
+        entries = []
+        for coord_str, crop_data in plots.items():
+            if crop_data is None:
+                continue
+            left, _, right = coord_str.partition(',')
+            entries.append((int(left), int(right), crop_data))
+        return entries
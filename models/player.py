@@ -1,12 +1,23 @@
 """Player state and progression."""
 
-from typing import Set, Dict, Any, List, Optional
+import json
+import math
+import sys
+from typing import AbstractSet, FrozenSet, Dict, Any, Optional, TextIO
 from config import STARTING_COINS, STARTING_UNLOCKED_CROPS, XP_PER_LEVEL
 
+# Shared by every player that hasn't unlocked anything yet
+_DEFAULT_UNLOCKED: FrozenSet[str] = frozenset(STARTING_UNLOCKED_CROPS)
+
 
 class Player:
     """Manages player resources, XP, and unlocks."""
 
+    __slots__ = (
+        'coins', 'experience', 'level', 'total_crops_planted',
+        'total_crops_harvested', 'unlocked_crops',
+    )
+
     def __init__(
         self,
         coins: int = STARTING_COINS,
@@ -14,7 +25,7 @@ class Player:
         level: int = 1,
         total_crops_planted: int = 0,
         total_crops_harvested: int = 0,
-        unlocked_crops: Optional[Set[str]] = None
+        unlocked_crops: Optional[AbstractSet[str]] = None
     ) -> None:
         """Initialize player state."""
         self.coins = coins
@@ -22,7 +33,20 @@ class Player:
         self.level = level
         self.total_crops_planted = total_crops_planted
         self.total_crops_harvested = total_crops_harvested
-        self.unlocked_crops = unlocked_crops or set(STARTING_UNLOCKED_CROPS)
+        # Immutable and replaced on unlock (copy-on-write), so the default
+        # can be shared instead of copied per player
+        self.unlocked_crops: FrozenSet[str] = (
+            frozenset(unlocked_crops) if unlocked_crops else _DEFAULT_UNLOCKED
+        )
+
+    def reset(self) -> None:
+        """Restore starting state, reusing this Player object."""
+        self.coins = STARTING_COINS
+        self.experience = 0
+        self.level = 1
+        self.total_crops_planted = 0
+        self.total_crops_harvested = 0
+        self.unlocked_crops = _DEFAULT_UNLOCKED
 
     @property
     def xp_for_next_level(self) -> int:
@@ -32,7 +56,8 @@ class Player:
     @property
     def xp_progress(self) -> float:
         """Get XP progress toward next level (0.0 to 1.0)."""
-        return min(1.0, self.experience / self.xp_for_next_level)
+        progress = self.experience / (self.level * XP_PER_LEVEL)
+        return 1.0 if progress > 1.0 else progress
 
     def add_coins(self, amount: int) -> None:
         """Add coins to player."""
@@ -64,18 +89,27 @@ class Player:
             Number of levels gained
         """
         self.experience += amount
-        levels_gained = 0
-
-        while self.experience >= self.xp_for_next_level:
-            self.experience -= self.xp_for_next_level
-            self.level += 1
-            levels_gained += 1
-
+        level = self.level
+        if self.experience < level * XP_PER_LEVEL:
+            return 0
+
+        # Level L costs L * XP_PER_LEVEL, so k level-ups cost
+        # XP_PER_LEVEL * (k*L + k*(k-1)/2). Solve k^2 + (2L-1)k <= 2E/XP
+        # for the largest integer k instead of looping once per level.
+        b = 2 * level - 1
+        c = int(2 * self.experience // XP_PER_LEVEL)
+        levels_gained = (math.isqrt(b * b + 4 * c) - b) // 2
+
+        self.experience -= XP_PER_LEVEL * (
+            levels_gained * level + levels_gained * (levels_gained - 1) // 2
+        )
+        self.level = level + levels_gained
         return levels_gained
 
     def unlock_crop(self, crop_type: str) -> None:
         """Unlock a new crop type."""
-        self.unlocked_crops.add(crop_type)
+        if crop_type not in self.unlocked_crops:
+            self.unlocked_crops = self.unlocked_crops | {crop_type}
 
     def has_crop_unlocked(self, crop_type: str) -> bool:
         """Check if player has unlocked a crop."""
@@ -92,6 +126,10 @@ class Player:
             'unlocked_crops': list(self.unlocked_crops),
         }
 
+    def write_json(self, fp: TextIO) -> None:
+        """Write the to_dict() form to a text stream as compact JSON."""
+        fp.write(json.dumps(self.to_dict(), separators=(',', ':')))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Player':
         """Deserialize player from dictionary."""
@@ -101,5 +139,7 @@ class Player:
             level=data['level'],
             total_crops_planted=data['total_crops_planted'],
             total_crops_harvested=data['total_crops_harvested'],
-            unlocked_crops=set(data['unlocked_crops']),
+            unlocked_crops=frozenset(
+                sys.intern(crop_type) for crop_type in data['unlocked_crops']
+            ),
         )
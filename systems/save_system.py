@@ -1,55 +1,183 @@
 """Save/load system with offline progression."""
 
+import contextlib
+import io
+import itertools
 import json
 import os
+import stat
+import tempfile
+import threading
 import time
 import logging
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, IO, Iterator, TextIO
 
 from config import (
-    SAVE_DIR, SAVE_FILE, OFFLINE_REWARD_MULTIPLIER,
-    MAX_OFFLINE_TIME, STARTING_FARM_SIZE, CROPS,
+    SAVE_FILE, OFFLINE_REWARD_MULTIPLIER,
+    MAX_OFFLINE_TIME, STARTING_FARM_SIZE,
     MIN_OFFLINE_TIME_TO_PROCESS
 )
 from models.farm import Farm
 from models.player import Player
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+# Expected shape of a save file: nested dicts are sub-schemas, anything
+# else is the allowed type(s) of the value. Checked before any model is built.
+_SAVE_SCHEMA: Dict[str, Any] = {
+    'version': int,
+    'last_save': (int, float),
+    'farm': {
+        'width': int,
+        'height': int,
+        'plots': (list, dict),  # dict in version 1/2 saves
+    },
+    'player': {
+        'coins': int,
+        'experience': int,
+        'level': int,
+        'total_crops_planted': int,
+        'total_crops_harvested': int,
+        'unlocked_crops': list,
+    },
+}
+
+
+def _schema_error(data: Any, schema: Dict[str, Any], path: str = '') -> Optional[str]:
+    """
+    Check data against a _SAVE_SCHEMA-style schema.
+
+    Args:
+        data: Decoded JSON value
+        schema: Mapping of required keys to types or nested schemas
+        path: Dotted location of data, for error messages
+
+    Returns:
+        Description of the first problem found, or None if data is valid
+    """
+    if not isinstance(data, dict):
+        return f"{path or 'save'} is not an object"
+    for key, expected in schema.items():
+        where = f"{path}.{key}" if path else key
+        if key not in data:
+            return f"missing field {where}"
+        value = data[key]
+        if isinstance(expected, dict):
+            error = _schema_error(value, expected, where)
+            if error:
+                return error
+        elif isinstance(value, bool) or not isinstance(value, expected):
+            return f"{where} has unexpected type {type(value).__name__}"
+    return None
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode save data, using orjson if available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class SaveSystem:
     """Handles game persistence and offline progression."""
 
+    # Version 3: plots stored as [x, y, [crop_type, planted_at]] triples
+    SAVE_VERSION = 3
+
+    # Serializes disk writes from the UI thread and background save workers
+    # (reentrant so write_bytes() can check staleness and write atomically)
+    _write_lock = threading.RLock()
+
+    # Game state snapshots are numbered as they are taken; a write whose
+    # snapshot is older than the one already on disk is dropped, so a slow
+    # auto-save worker can't overwrite the save made on quit
+    _snapshot_seq = itertools.count(1)
+    _written_seq = 0
+
+    # Where saves are read and written; tests point this at tmp_path
+    SAVE_FILE_PATH: str = SAVE_FILE
+
+    # Directory last confirmed to exist by ensure_save_directory()
+    _ready_save_dir: Optional[str] = None
+
     @staticmethod
     def ensure_save_directory() -> None:
         """Create save directory if it doesn't exist."""
-        if not os.path.exists(SAVE_DIR):
-            os.makedirs(SAVE_DIR)
+        save_dir = os.path.dirname(SaveSystem.SAVE_FILE_PATH)
+        if SaveSystem._ready_save_dir == save_dir:
+            return
+        os.makedirs(save_dir, exist_ok=True)
+        SaveSystem._ready_save_dir = save_dir
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _atomic_save_file(mode: str, seq: int) -> Iterator[IO]:
+        """
+        Open a uniquely named temp file next to the save file.
+
+        On a clean exit the temp file is swapped in with os.replace(), so a
+        reader never sees a half-written save; on error it is removed and
+        the previous save is left untouched. The temp file is given the
+        existing save's permissions (or the umask default for a first save)
+        rather than mkstemp's 0600. Holds the write lock throughout.
+
+        Args:
+            mode: 'w' for text or 'wb' for bytes
+            seq: Snapshot number being written, recorded on success
+        """
+        with SaveSystem._write_lock:
+            save_file = SaveSystem.SAVE_FILE_PATH
+            fd, tmp_file = tempfile.mkstemp(
+                dir=os.path.dirname(save_file), prefix='.savegame-', suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, mode) as f:
+                    yield f
+                try:
+                    file_mode = stat.S_IMODE(os.stat(save_file).st_mode)
+                except FileNotFoundError:
+                    file_mode = 0o666 & ~_UMASK
+                os.chmod(tmp_file, file_mode)
+                os.replace(tmp_file, save_file)
+                SaveSystem._written_seq = seq
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_file)
+                raise
 
     @staticmethod
-    def save_game(farm: Farm, player: Player) -> bool:
+    def save_game(farm: Farm, player: Player, pretty: bool = False) -> bool:
         """
-        Save game state to disk.
+        Save game state to disk atomically.
 
         Args:
             farm: Farm object to save
             player: Player object to save
+            pretty: Write indented JSON for debugging instead of the compact
+                streamed form used during play
 
         Returns:
             True if saved successfully
         """
         SaveSystem.ensure_save_directory()
-
-        data = {
-            'version': 1,
-            'last_save': time.time(),
-            'farm': farm.to_dict(),
-            'player': player.to_dict(),
-        }
+        seq = next(SaveSystem._snapshot_seq)
 
         try:
-            with open(SAVE_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            with SaveSystem._atomic_save_file('w', seq) as f:
+                if pretty:
+                    json.dump(SaveSystem._build_save_data(farm, player), f, indent=2)
+                else:
+                    SaveSystem._write_save_data(f, farm, player)
             logger.info("Game saved successfully")
             return True
         except (IOError, OSError) as e:
@@ -59,6 +187,83 @@ class SaveSystem:
             logger.error(f"Unexpected error saving game: {e}")
             return False
 
+    @staticmethod
+    def serialize(farm: Farm, player: Player) -> Tuple[int, bytes]:
+        """
+        Snapshot game state into save-file bytes.
+
+        Call this on the UI thread so the snapshot is consistent, then hand
+        the result to write_bytes() on a worker thread.
+
+        Args:
+            farm: Farm object to save
+            player: Player object to save
+
+        Returns:
+            Tuple of (snapshot number, UTF-8 encoded JSON save data)
+        """
+        seq = next(SaveSystem._snapshot_seq)
+        buffer = io.StringIO()
+        SaveSystem._write_save_data(buffer, farm, player)
+        return seq, buffer.getvalue().encode('utf-8')
+
+    @staticmethod
+    def write_bytes(seq: int, data: bytes) -> bool:
+        """
+        Write serialized save data to disk atomically.
+
+        Safe to call from a worker thread. Writes that arrive after a newer
+        snapshot has been saved are skipped.
+
+        Args:
+            seq: Snapshot number returned by serialize()
+            data: Bytes returned by serialize()
+
+        Returns:
+            True if saved successfully, False on error or if superseded
+        """
+        SaveSystem.ensure_save_directory()
+
+        try:
+            with SaveSystem._write_lock:
+                if seq < SaveSystem._written_seq:
+                    logger.info("Skipped save of an outdated snapshot")
+                    return False
+                with SaveSystem._atomic_save_file('wb', seq) as f:
+                    f.write(data)
+            logger.info("Game saved successfully")
+            return True
+        except (IOError, OSError) as e:
+            logger.error(f"Error saving game: {e}")
+            return False
+
+    @staticmethod
+    def _write_save_data(fp: TextIO, farm: Farm, player: Player) -> None:
+        """
+        Stream the top-level save object to a text stream.
+
+        The farm and player write themselves, so no intermediate save
+        dictionary is built.
+        """
+        fp.write(
+            f'{{"version":{SaveSystem.SAVE_VERSION},'
+            f'"last_save":{time.time()!r},"farm":'
+        )
+        farm.write_json(fp)
+        fp.write(',"player":')
+        player.write_json(fp)
+        fp.write('}')
+
+    @staticmethod
+    def _build_save_data(farm: Farm, player: Player) -> Dict[str, Any]:
+        """Build the top-level save dictionary (for pretty-printed saves)."""
+        return {
+            'version': SaveSystem.SAVE_VERSION,
+            'last_save': time.time(),
+            'farm': farm.to_dict(),
+            'player': player.to_dict(),
+        }
+
     @staticmethod
     def load_game() -> Optional[Tuple[Farm, Player, Dict[str, Any]]]:
         """
@@ -72,16 +277,14 @@ class SaveSystem:
                 'total_coins': int
             }
         """
-        if not os.path.exists(SAVE_FILE):
-            return None
-
         try:
-            with open(SAVE_FILE, 'r') as f:
-                data = json.load(f)
+            with open(SaveSystem.SAVE_FILE_PATH, 'rb') as f:
+                data = _loads(f.read())
 
-            # Validate save file structure
-            if not all(key in data for key in ['version', 'last_save', 'farm', 'player']):
-                logger.error("Save file missing required fields")
+            # Validate save file structure before building any models
+            error = _schema_error(data, _SAVE_SCHEMA)
+            if error:
+                logger.error(f"Invalid save file: {error}")
                 return None
 
             farm = Farm.from_dict(data['farm'])
@@ -96,7 +299,9 @@ class SaveSystem:
             logger.info("Game loaded successfully")
             return farm, player, offline_summary
 
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            return None  # No save yet
+        except json.JSONDecodeError as e:  # orjson's error subclasses this
             logger.error(f"Corrupted save file (invalid JSON): {e}")
             return None
         except (IOError, OSError) as e:
@@ -126,7 +331,9 @@ class SaveSystem:
         Returns:
             Dictionary with offline summary
         """
-        offline_time = min(time.time() - last_save, MAX_OFFLINE_TIME)
+        # Offline processing happens at a single instant
+        now = time.time()
+        offline_time = min(now - last_save, MAX_OFFLINE_TIME)
 
         if offline_time < MIN_OFFLINE_TIME_TO_PROCESS:
             return {
@@ -138,24 +345,29 @@ class SaveSystem:
         auto_harvested = []
         total_coins = 0
 
-        # Check all crops
-        for (x, y), crop in list(farm.plots.items()):
-            if crop is None:
-                continue
+        # Offline payout per crop type; many ripe crops share a config
+        rewards: Dict[str, int] = {}
 
-            # Check if crop finished during offline time
-            time_since_plant = time.time() - crop.planted_at
-            if time_since_plant >= crop.config.growth_time:
-                # Auto-harvest at 70% value
+        # Find crops that finished during offline time, then pay out only those
+        width = farm.width
+        for idx in farm.ripe_indices(now):
+            crop = farm.plots[idx]
+
+            # Auto-harvest at 70% value
+            coins_earned = rewards.get(crop.crop_type)
+            if coins_earned is None:
                 coins_earned = int(crop.config.sell_price * OFFLINE_REWARD_MULTIPLIER)
-                player.add_coins(coins_earned)
-                player.total_crops_harvested += 1
-                total_coins += coins_earned
+                rewards[crop.crop_type] = coins_earned
+            total_coins += coins_earned
+
+            auto_harvested.append((crop.name, coins_earned))
 
-                auto_harvested.append((crop.config.name, coins_earned))
+            # Clear the plot
+            farm.harvest_crop(idx % width, idx // width)
 
-                # Clear the plot
-                farm.plots[(x, y)] = None
+        # Apply the whole batch to the player at once
+        player.add_coins(total_coins)
+        player.total_crops_harvested += len(auto_harvested)
 
         return {
             'offline_time': offline_time,
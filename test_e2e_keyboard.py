@@ -7,11 +7,13 @@ import time
 from textual.pilot import Pilot
 from main import FarmGame
 from config import CROPS
+from systems.save_system import SaveSystem
 
 
 @pytest.fixture(scope="function")
-async def app():
-    """Create and return an app instance."""
+async def app(tmp_path, monkeypatch):
+    """Create and return an app instance with a fresh, per-test save file."""
+    monkeypatch.setattr(SaveSystem, 'SAVE_FILE_PATH', str(tmp_path / "savegame.json"))
     app = FarmGame()
     async with app.run_test() as pilot:
         # Wait for app to fully initialize
@@ -32,7 +34,7 @@ class TestKeyboardNavigation:
         assert game.focused_plot == (0, 0)
 
         # Check that first plot has focus class
-        plot = game.farm_grid.plots.get((0, 0))
+        plot = game.farm_grid.get_plot(0, 0)
         assert plot is not None
         assert plot.has_class("plot")
 
@@ -146,10 +148,11 @@ class TestSeedSelector:
         await pilot.press("enter")
         await pilot.pause(0.3)
 
-        # Check if selector is present
+        # Check if selector is present and visible
         try:
             selector = game.query_one("#seed-selector")
             assert selector is not None
+            assert selector.display
         except:
             pytest.fail("Seed selector should be open")
 
@@ -166,12 +169,57 @@ class TestSeedSelector:
         await pilot.press("escape")
         await pilot.pause(0.3)
 
-        # Check if selector is closed
-        try:
-            game.query_one("#seed-selector")
-            pytest.fail("Seed selector should be closed")
-        except:
-            pass  # Expected - selector is gone
+        # Check if selector is closed (hidden, kept mounted for reuse)
+        selector = game.query_one("#seed-selector")
+        assert not selector.display
+
+        # Focus returns to the plot the selector was opened from
+        assert game.focused is game.farm_grid.get_plot(0, 0)
+
+    @pytest.mark.asyncio
+    async def test_seed_selector_focus_cycles(self, app):
+        """Test that j/k cycle focus through selector buttons and wrap."""
+        pilot, game = app
+
+        # Open selector
+        await pilot.press("enter")
+        await pilot.pause(0.3)
+
+        selector = game.query_one("#seed-selector")
+        buttons = list(selector.query("Button"))
+        assert game.focused is buttons[0]
+
+        # Move down one
+        await pilot.press("j")
+        await pilot.pause(0.1)
+        assert game.focused is buttons[1]
+
+        # Move up twice, wrapping to the last button (Cancel)
+        await pilot.press("k")
+        await pilot.press("k")
+        await pilot.pause(0.1)
+        assert game.focused is buttons[-1]
+
+    @pytest.mark.asyncio
+    async def test_seed_selector_is_reused(self, app):
+        """Test that reopening the selector reuses the same widget."""
+        pilot, game = app
+
+        # Open and close once
+        await pilot.press("enter")
+        await pilot.pause(0.3)
+        first = game.query_one("#seed-selector")
+        await pilot.press("escape")
+        await pilot.pause(0.3)
+
+        # Reopen on the same plot
+        await pilot.press("enter")
+        await pilot.pause(0.3)
+
+        selectors = list(game.query("#seed-selector"))
+        assert selectors == [first]
+        assert first.display
+        assert game.focused is first.query_one("#seed-RADISH")
 
     @pytest.mark.asyncio
     async def test_select_seed_from_selector(self, app):
@@ -194,6 +242,9 @@ class TestSeedSelector:
         assert crop.crop_type == "RADISH"
         assert game.player.coins < initial_coins
 
+        # Planted plot widget is refreshed immediately
+        assert game.farm_grid.get_plot(0, 0).crop is crop
+
 
 class TestPlantingAndHarvesting:
     """Test planting and harvesting with keyboard."""
@@ -223,6 +274,26 @@ class TestPlantingAndHarvesting:
         # Check that crop was harvested
         assert game.farm.get_crop(0, 0) is None
         assert game.player.coins > initial_coins
+        assert game.farm_grid.get_plot(0, 0).crop is None
+
+    @pytest.mark.asyncio
+    async def test_harvest_crop_that_ripened_since_last_tick(self, app):
+        """Test that Enter harvests a crop even if the last tick saw it growing."""
+        pilot, game = app
+
+        game.farm.plant_crop(0, 0, 'RADISH')
+        game.farm_grid.update_all_plots()
+        await pilot.pause(0.1)
+
+        crop = game.farm.get_crop(0, 0)
+        crop.planted_at = time.time() - CROPS['RADISH'].growth_time - 1
+        crop.update(crop.planted_at + 1)  # Snapshot from before it ripened
+        assert not crop.is_ready
+
+        await pilot.press("enter")
+        await pilot.pause(0.3)
+
+        assert game.farm.get_crop(0, 0) is None
 
     @pytest.mark.asyncio
     async def test_check_growing_crop_info(self, app):
@@ -240,6 +311,27 @@ class TestPlantingAndHarvesting:
         # Crop should still be there (not harvested)
         assert game.farm.get_crop(0, 0) is not None
 
+    @pytest.mark.asyncio
+    async def test_plot_state_class_follows_crop(self, app):
+        """Test that a plot carries exactly one of the empty/growing/ready classes."""
+        pilot, game = app
+        plot = game.farm_grid.get_plot(0, 0)
+
+        def state_classes():
+            return {name for name in ("empty", "growing", "ready") if plot.has_class(name)}
+
+        assert state_classes() == {"empty"}
+
+        game.farm.plant_crop(0, 0, 'RADISH')
+        game.farm_grid.update_all_plots()
+        await pilot.pause(0.1)
+        assert state_classes() == {"growing"}
+
+        game.farm.get_crop(0, 0).planted_at = time.time() - CROPS['RADISH'].growth_time - 1
+        game.farm_grid.update_all_plots()
+        await pilot.pause(0.1)
+        assert state_classes() == {"ready"}
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -339,6 +431,29 @@ class TestKeyboardShortcuts:
         assert game.focused_plot == (0, 0)
 
 
+class TestSidebar:
+    """Test sidebar stats updates."""
+
+    @pytest.mark.asyncio
+    async def test_batch_update_renders_once(self, app):
+        """Test that updating every stat at once renders the sidebar once."""
+        pilot, game = app
+        sidebar = game.sidebar
+        renders = []
+        original = sidebar.render_stats
+        sidebar.render_stats = lambda: renders.append(1) or original()
+
+        game.player.coins = 1234
+        game.player.add_experience(250)
+        sidebar.update_from_player(game.player, 3)
+        assert len(renders) == 1
+        assert "1234" in original()
+
+        # Nothing changed, nothing to render
+        sidebar.update_from_player(game.player, 3)
+        assert len(renders) == 1
+
+
 class TestFocusManagement:
     """Test focus management and visual feedback."""
 
@@ -347,7 +462,7 @@ class TestFocusManagement:
         """Test that focused plot has proper CSS class."""
         pilot, game = app
 
-        plot = game.farm_grid.plots.get((0, 0))
+        plot = game.farm_grid.get_plot(0, 0)
         assert plot is not None
 
         # Should have plot class
@@ -359,14 +474,14 @@ class TestFocusManagement:
         pilot, game = app
 
         # Start at (0, 0)
-        start_plot = game.farm_grid.plots.get((0, 0))
+        start_plot = game.farm_grid.get_plot(0, 0)
 
         # Move right
         await pilot.press("l")
         await pilot.pause(0.1)
 
         # Check new plot
-        new_plot = game.farm_grid.plots.get((1, 0))
+        new_plot = game.farm_grid.get_plot(1, 0)
         assert game.focused_plot == (1, 0)
 
 
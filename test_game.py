@@ -1,25 +1,72 @@
 #!/usr/bin/env python3
 """Unit tests for game components using pytest."""
 
+import dataclasses
+import io
+import json
+import os
 import pytest
+import sys
 import time
-from models.crop import Crop
+from models.crop import Crop, GrowthStage
 from models.farm import Farm
 from models.player import Player
+from systems import save_system
 from systems.save_system import SaveSystem
-from config import CROPS, XP_PER_LEVEL, SAVE_FILE
+from config import CROPS, CROPS_BY_UNLOCK_LEVEL, SAVE_FILE, STAGE_EMOJIS, XP_PER_LEVEL
+
+
+# Growth time in seconds of every configured crop
+EXPECTED_GROWTH_TIMES = {
+    'RADISH': 30,
+    'CARROT': 60,
+    'WHEAT': 120,
+    'TOMATO': 180,
+    'CORN': 300,
+    'PUMPKIN': 600,
+}
+
+
+@pytest.fixture(scope="module")
+def shared_farm():
+    """One farm for the module, reset per test by the farm fixture."""
+    return Farm(4, 4)
+
+
+@pytest.fixture(scope="module")
+def shared_player():
+    """One player for the module, reset per test by the player fixture."""
+    return Player()
+
+
+@pytest.fixture(scope="module", params=list(CROPS))
+def any_crop_type(request):
+    """Each configured crop type in turn."""
+    return request.param
+
+
+@pytest.fixture
+def past_time():
+    """A timestamp 100 seconds ago, long enough for fast crops to ripen."""
+    return time.time() - 100
 
 
 class TestCrop:
     """Test crop growth system."""
 
-    def test_crop_creation(self):
+    def test_crop_creation(self, any_crop_type):
         """Test basic crop creation."""
-        radish = Crop('RADISH')
-        assert radish.crop_type == 'RADISH'
-        assert radish.config.growth_time == 30
-        assert radish.growth_progress >= 0.0
-        assert not radish.is_ready
+        crop = Crop(any_crop_type)
+        assert crop.crop_type == any_crop_type
+        assert crop.config.growth_time == EXPECTED_GROWTH_TIMES[any_crop_type]
+        assert crop.growth_progress >= 0.0
+        assert not crop.is_ready
+
+    def test_crop_copies_display_fields(self):
+        """Test that emoji and name are available directly on the crop."""
+        carrot = Crop('CARROT')
+        assert carrot.emoji == CROPS['CARROT'].emoji
+        assert carrot.name == CROPS['CARROT'].name
 
     def test_crop_invalid_type(self):
         """Test that invalid crop type raises ValueError."""
@@ -31,59 +78,126 @@ class TestCrop:
         with pytest.raises(ValueError, match="Invalid planted_at timestamp"):
             Crop('RADISH', planted_at=-100)
 
-    def test_crop_serialization(self):
+    def test_crop_serialization(self, any_crop_type):
         """Test crop serialization and deserialization."""
-        radish = Crop('RADISH')
-        data = radish.to_dict()
-        radish2 = Crop.from_dict(data)
+        crop = Crop(any_crop_type)
+        data = crop.to_tuple()
+        crop2 = Crop.from_tuple(data)
+
+        assert crop2.crop_type == crop.crop_type
+        assert crop2.planted_at == crop.planted_at
 
-        assert radish2.crop_type == radish.crop_type
-        assert radish2.planted_at == radish.planted_at
+    def test_loaded_crop_type_is_interned(self):
+        """Test that crop types decoded from a save share the canonical string."""
+        data = json.loads('["RADISH", 0.0]')
+        assert Crop.from_tuple(data).crop_type is sys.intern('RADISH')
+
+    def test_crop_from_legacy_dict(self):
+        """Test loading a crop saved in the version 1 dict format."""
+        crop = Crop.from_dict({'crop_type': 'CARROT', 'planted_at': 1000.0})
+        assert crop.crop_type == 'CARROT'
+        assert crop.planted_at == 1000.0
 
     def test_crop_growth_over_time(self):
         """Test that crops actually grow over time."""
         crop = Crop('RADISH')
         initial_progress = crop.growth_progress
 
-        # Wait a moment
-        time.sleep(0.5)
+        # Move the planting half a second into the past instead of sleeping
+        crop.planted_at -= 0.5
 
         new_progress = crop.growth_progress
         assert new_progress > initial_progress, "Crop should have grown"
 
-    def test_crop_ready_state(self):
+    def test_crop_ready_state(self, past_time, monkeypatch):
         """Test that crop becomes ready after growth time."""
-        # Create crop planted in the past
-        past_time = time.time() - 100  # 100 seconds ago
+        monkeypatch.setattr(time, "time", lambda: past_time + 100)
         crop = Crop('RADISH', planted_at=past_time)
 
         assert crop.is_ready
         assert crop.time_remaining == "Ready!"
 
-    def test_crop_stage_progression(self):
+    def test_crop_time_remaining_format(self):
+        """Test human-readable time remaining for seconds, minutes and hours."""
+        crop = Crop('PUMPKIN', planted_at=1000.0)  # 600s growth time
+
+        crop.update(1000.0 + 569.5)
+        assert crop.time_remaining == "30s"
+
+        crop.update(1000.0 + 464.5)
+        assert crop.time_remaining == "2m 15s"
+
+        crop.update(1000.0 + 479.5)
+        assert crop.time_remaining == "2m"
+
+    def test_crop_stage_progression(self, monkeypatch):
         """Test that growth stages progress correctly."""
-        current_time = time.time()
+        current_time = 1_000_000.0
+        monkeypatch.setattr(time, "time", lambda: current_time)  # Frozen clock
 
         # Just planted (0% progress)
         crop1 = Crop('RADISH', planted_at=current_time)
-        assert crop1.current_stage.value == "PLANTED"
+        assert crop1.current_stage == GrowthStage.PLANTED
 
         # 50% progress
         crop2 = Crop('RADISH', planted_at=current_time - 15)
-        assert crop2.current_stage.value in ["SPROUTING", "GROWING", "FLOWERING"]
+        assert crop2.current_stage == GrowthStage.GROWING
 
-        # Ready (100% progress)
+        # Ready (over 100% progress)
         crop3 = Crop('RADISH', planted_at=current_time - 35)
-        assert crop3.current_stage.value == "READY"
+        assert crop3.current_stage == GrowthStage.READY
+        assert crop3.stage_emoji == STAGE_EMOJIS['READY']
+
+    @pytest.mark.parametrize("elapsed,expected", [
+        (0, GrowthStage.PLANTED),
+        (6, GrowthStage.SPROUTING),
+        (12, GrowthStage.GROWING),
+        (18, GrowthStage.FLOWERING),
+        (29, GrowthStage.FLOWERING),
+        (30, GrowthStage.READY),
+    ])
+    def test_crop_stage_boundaries(self, elapsed, expected):
+        """Test stage buckets at 20% progress steps for a 30s radish."""
+        crop = Crop('RADISH', planted_at=1000.0)
+        crop.update(1000.0 + elapsed)
+        assert crop.current_stage == expected
+
+    def test_crop_ready_at_follows_planted_at(self):
+        """Test that ready_at is precomputed and kept in step with planted_at."""
+        crop = Crop('RADISH', planted_at=1000.0)
+        assert crop.ready_at == 1030.0
+        crop.update(1029.0)
+        assert not crop.is_ready
+
+        crop.planted_at = 900.0
+        assert crop.ready_at == 930.0
+        assert crop.snapshot(1029.0) == (pytest.approx(129 / 30), GrowthStage.READY, True)
+
+    def test_crop_update_snapshot(self):
+        """Test that update() pins growth state to the given timestamp."""
+        planted_at = time.time()
+        crop = Crop('RADISH', planted_at=planted_at)
+
+        crop.update(planted_at + 15)
+        assert crop.growth_progress == pytest.approx(0.5)
+        assert not crop.is_ready
+
+        assert crop.progress_bar == "████░░░░"
+
+        crop.update(planted_at + 30)
+        assert crop.is_ready
+        assert crop.progress_bar == "████████"
+        assert crop.current_stage == GrowthStage.READY
 
 
 class TestFarm:
     """Test farm management."""
 
     @pytest.fixture
-    def farm(self):
-        """Create a farm for testing."""
-        return Farm(4, 4)
+    def farm(self, shared_farm):
+        """Reset the shared farm to an empty 4x4 grid for each test."""
+        shared_farm.reset(4, 4)
+        return shared_farm
 
     def test_farm_creation(self, farm):
         """Test basic farm creation."""
@@ -121,20 +235,181 @@ class TestFarm:
         crop = farm.harvest_crop(0, 0)
         assert crop is None
 
-    def test_get_ready_crops(self, farm):
+    def test_get_ready_crops(self, farm, past_time, monkeypatch):
         """Test getting ready crops."""
+        monkeypatch.setattr(time, "time", lambda: past_time + 100)
         # Plant some crops
         farm.plant_crop(0, 0, 'RADISH')
         farm.plant_crop(1, 1, 'CARROT')
 
         # Make them ready by manipulating time
-        past_time = time.time() - 100
-        farm.plots[(0, 0)].planted_at = past_time
-        farm.plots[(1, 1)].planted_at = past_time
+        farm.get_crop(0, 0).planted_at = past_time
+        farm.get_crop(1, 1).planted_at = past_time
 
         ready_crops = farm.get_ready_crops()
         assert len(ready_crops) == 2
 
+    def test_get_ready_crops_reflects_current_time(self, farm):
+        """Test that readiness is judged at the given time, not remembered."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.plant_crop(1, 1, 'PUMPKIN')
+        planted_at = farm.get_crop(0, 0).planted_at
+
+        assert [(x, y) for x, y, _ in farm.get_ready_crops(planted_at + 100)] == [(0, 0)]
+        assert farm.get_ready_crops(planted_at + 1) == []
+
+        farm.harvest_crop(0, 0)
+        assert farm.get_ready_crops(planted_at + 100) == []
+
+    def test_get_ready_crops_uses_tick_time(self, farm):
+        """Test that get_ready_crops defaults to the last tick's timestamp."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.tick(farm.get_crop(0, 0).planted_at + 31)
+        assert len(farm.get_ready_crops()) == 1
+
+    def test_active_plot_coords(self, farm):
+        """Test that only plots whose display may change are reported."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.plant_crop(1, 0, 'PUMPKIN')
+        planted_at = farm.get_crop(0, 0).planted_at
+
+        farm.tick(planted_at + 10)
+        assert farm.get_active_plot_coords() == [(0, 0), (1, 0)]
+
+        # Radish ripens: reported once, then idle
+        farm.tick(planted_at + 31)
+        assert farm.get_active_plot_coords() == [(0, 0), (1, 0)]
+        farm.tick(planted_at + 32)
+        assert farm.get_active_plot_coords() == [(1, 0)]
+
+        # Harvesting marks the plot for one more refresh
+        farm.harvest_crop(0, 0)
+        farm.tick(planted_at + 33)
+        assert farm.get_active_plot_coords() == [(0, 0), (1, 0)]
+
+    def test_get_ready_crops_after_replant_and_expand(self, farm):
+        """Test that replanted plots and widened grids report current crops."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.harvest_crop(0, 0)
+        farm.plant_crop(0, 0, 'PUMPKIN')
+        farm.plant_crop(3, 1, 'RADISH')
+        farm.expand(6, 4)
+
+        ready_crops = farm.get_ready_crops(time.time() + 100)
+        assert [(x, y, crop.crop_type) for x, y, crop in ready_crops] == [(3, 1, 'RADISH')]
+
+    def test_ripe_indices_follows_retimed_crop(self, farm):
+        """Test that moving planted_at either way changes when a crop is ripe."""
+        farm.plant_crop(0, 0, 'RADISH')
+        crop = farm.get_crop(0, 0)
+        original_ready_at = crop.ready_at
+
+        crop.planted_at += 100  # Later
+        assert farm.ripe_indices(original_ready_at) == []
+        assert farm.ripe_indices(crop.ready_at) == [0]
+
+        crop.planted_at -= 200  # Earlier than originally planted
+        assert farm.ripe_indices(original_ready_at - 50) == [0]
+
+    def test_ripe_indices(self, farm):
+        """Test that ripe_indices filters by growth time without side effects."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.plant_crop(1, 0, 'PUMPKIN')
+        now = farm.get_crop(0, 0).planted_at + 31
+
+        assert farm.ripe_indices(now) == [farm._idx(0, 0)]
+        assert farm.get_crop(0, 0) is not None
+        assert farm.ripe_indices(now) == [farm._idx(0, 0)]  # Repeatable
+
+        # Direct planted_at edits are seen on the next call
+        farm.get_crop(1, 0).planted_at = now - 600
+        assert farm.ripe_indices(now) == [farm._idx(0, 0), farm._idx(1, 0)]
+
+    def test_ready_count_tracks_ticks_and_harvests(self, farm):
+        """Test that ready_count is refreshed by tick() and decremented on harvest."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.plant_crop(1, 1, 'CARROT')
+        planted_at = farm.get_crop(0, 0).planted_at
+
+        farm.tick(planted_at + 1)
+        assert farm.ready_count == 0
+
+        farm.tick(planted_at + 45)  # Radish (30s) ready, carrot (60s) not
+        assert farm.ready_count == 1
+
+        farm.harvest_crop(0, 0)
+        assert farm.ready_count == 0
+
+    def test_harvest_adjusts_count_tick_used(self, farm, past_time):
+        """Test that harvest decrements the counter the crop was last counted in."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.tick(farm.get_crop(0, 0).planted_at + 1)
+        assert farm.has_active_crops
+
+        # Ready by the clock now, but tick() last counted it as growing
+        farm.get_crop(0, 0).planted_at = past_time
+        farm.harvest_crop(0, 0)
+        assert farm.ready_count == 0
+        assert not farm.has_active_crops
+
+    def test_ready_count_agrees_with_get_ready_crops(self, farm, past_time):
+        """Test that tick() and get_ready_crops() share one view of readiness."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.plant_crop(1, 1, 'PUMPKIN')
+        crop = farm.get_crop(0, 0)
+        crop.planted_at = past_time  # Backdated after planting
+
+        now = past_time + 100
+        farm.tick(now)
+        assert farm.ready_count == len(farm.get_ready_crops()) == 1
+
+        crop.planted_at = now  # Re-timed to ripen later again
+        farm.tick(now + 1)
+        assert farm.ready_count == len(farm.get_ready_crops()) == 0
+        assert not crop.is_ready
+
+    def test_tick_skips_crops_already_ready(self, farm):
+        """Test that tick() stops snapshotting a crop once it is seen ready."""
+        farm.plant_crop(0, 0, 'RADISH')
+        farm.plant_crop(1, 0, 'PUMPKIN')
+        planted_at = farm.get_crop(0, 0).planted_at
+
+        farm.tick(planted_at + 45)
+        farm.tick(planted_at + 90)
+        radish = farm.get_crop(0, 0)
+        assert radish.is_ready
+        assert radish.growth_progress == pytest.approx(45 / 30)  # Not re-snapshotted
+        assert farm.get_crop(1, 0).growth_progress == pytest.approx(90 / 600, abs=0.01)
+        assert farm.ready_count == 1
+        assert farm.has_active_crops
+
+    def test_has_active_crops(self, farm):
+        """Test that has_active_crops is False once every crop is ready or harvested."""
+        assert not farm.has_active_crops
+
+        farm.plant_crop(0, 0, 'RADISH')
+        assert farm.has_active_crops
+
+        farm.tick(farm.get_crop(0, 0).planted_at + 30)
+        assert not farm.has_active_crops
+
+        farm.plant_crop(1, 0, 'RADISH')
+        farm.harvest_crop(1, 0)
+        assert not farm.has_active_crops
+
+    def test_occupied_plots_tracked(self, farm):
+        """Test that only planted plots are tracked for scanning."""
+        farm.plant_crop(1, 2, 'RADISH')
+        farm.plant_crop(3, 0, 'CARROT')
+        assert farm._occupied == {farm._idx(1, 2), farm._idx(3, 0)}
+
+        farm.harvest_crop(3, 0)
+        assert farm._occupied == {farm._idx(1, 2)}
+
+        farm.expand(6, 6)
+        assert farm._occupied == {farm._idx(1, 2)}
+        assert farm.plots[farm._idx(1, 2)].crop_type == 'RADISH'
+
     def test_farm_expansion(self, farm):
         """Test farm expansion."""
         assert farm.expand(6, 6)
@@ -142,6 +417,38 @@ class TestFarm:
         assert farm.height == 6
         assert len(farm.plots) == 36
 
+    def test_farm_expansion_keeps_crops(self, farm):
+        """Test that crops keep their coordinates when the grid is re-packed."""
+        farm.plant_crop(3, 1, 'RADISH')
+        farm.plant_crop(0, 3, 'CARROT')
+        assert farm.expand(6, 5)
+
+        assert farm.get_crop(3, 1).crop_type == 'RADISH'
+        assert farm.get_crop(0, 3).crop_type == 'CARROT'
+        assert farm.get_crop(5, 4) is None
+        assert sum(crop is not None for crop in farm.plots) == 2
+
+        # Adding rows only keeps existing indices
+        assert farm.expand(6, 7)
+        assert len(farm.plots) == 42
+        assert farm.get_crop(3, 1).crop_type == 'RADISH'
+        assert farm._occupied == {farm._idx(3, 1), farm._idx(0, 3)}
+
+    def test_farm_write_json(self, farm):
+        """Test that streamed JSON matches to_dict()."""
+        farm.plant_crop(2, 1, 'RADISH')
+        buffer = io.StringIO()
+        farm.write_json(buffer)
+
+        data = json.loads(buffer.getvalue())
+        expected = farm.to_dict()
+        expected['plots'] = [[x, y, list(crop)] for x, y, crop in expected['plots']]
+        assert data == expected
+
+        restored = Farm.from_dict(data)
+        assert restored.get_crop(2, 1).planted_at == farm.get_crop(2, 1).planted_at
+        assert restored.get_crop(0, 0) is None
+
     def test_farm_cannot_shrink(self, farm):
         """Test that farm cannot shrink."""
         assert not farm.expand(2, 2)
@@ -158,15 +465,44 @@ class TestFarm:
         assert farm2.height == farm.height
         assert farm2.get_crop(1, 1) is not None
         assert farm2.get_crop(1, 1).crop_type == 'WHEAT'
+        assert [entry[:2] for entry in data['plots']] == [(1, 1)]  # Empty plots are not saved
+
+    def test_farm_from_legacy_dict(self):
+        """Test loading a farm saved with version 1 per-crop dicts."""
+        data = {
+            'width': 2,
+            'height': 2,
+            'plots': {
+                "0,0": {'crop_type': 'RADISH', 'planted_at': 1000.0},
+                "0,1": None,
+                "1,0": None,
+                "1,1": None,
+            },
+        }
+        farm = Farm.from_dict(data)
+        assert farm.get_crop(0, 0).crop_type == 'RADISH'
+        assert farm.get_crop(1, 1) is None
+
+    def test_farm_from_version_2_dict(self):
+        """Test loading a farm saved with "x,y" keys and crop pairs."""
+        data = {
+            'width': 2,
+            'height': 2,
+            'plots': {"1,0": ['CARROT', 1000.0], "0,1": None},
+        }
+        farm = Farm.from_dict(data)
+        assert farm.get_crop(1, 0).crop_type == 'CARROT'
+        assert farm.get_crop(0, 1) is None
 
 
 class TestPlayer:
     """Test player progression."""
 
     @pytest.fixture
-    def player(self):
-        """Create a player for testing."""
-        return Player()
+    def player(self, shared_player):
+        """Reset the shared player to starting state for each test."""
+        shared_player.reset()
+        return shared_player
 
     def test_player_creation(self, player):
         """Test basic player creation."""
@@ -205,6 +541,19 @@ class TestPlayer:
         assert player.level == 4
         assert player.experience == 0
 
+    def test_add_experience_large_award(self, player):
+        """Test that a huge XP award matches levelling up one step at a time."""
+        amount = 1_234_567
+        expected_level, remaining = 1, amount
+        while remaining >= expected_level * XP_PER_LEVEL:
+            remaining -= expected_level * XP_PER_LEVEL
+            expected_level += 1
+
+        levels = player.add_experience(amount)
+        assert levels == expected_level - 1
+        assert player.level == expected_level
+        assert player.experience == remaining
+
     def test_add_experience_partial(self, player):
         """Test adding partial experience."""
         levels = player.add_experience(50)
@@ -225,6 +574,16 @@ class TestPlayer:
         player.unlock_crop('WHEAT')
         assert player.has_crop_unlocked('WHEAT')
 
+    def test_default_unlocks_are_shared_until_written(self):
+        """Test that new players share the default unlock set copy-on-write."""
+        player1 = Player()
+        player2 = Player()
+        assert player1.unlocked_crops is player2.unlocked_crops
+
+        player1.unlock_crop('WHEAT')
+        assert player1.has_crop_unlocked('WHEAT')
+        assert not player2.has_crop_unlocked('WHEAT')
+
     def test_player_serialization(self, player):
         """Test player serialization and deserialization."""
         player.spend_coins(10)
@@ -243,6 +602,13 @@ class TestPlayer:
 class TestSaveSystem:
     """Test save/load system."""
 
+    @pytest.fixture(autouse=True)
+    def save_file(self, tmp_path, monkeypatch):
+        """Point SaveSystem at a per-test save file."""
+        path = str(tmp_path / "savegame.json")
+        monkeypatch.setattr(SaveSystem, 'SAVE_FILE_PATH', path)
+        return path
+
     @pytest.fixture
     def game_state(self):
         """Create a game state for testing."""
@@ -257,6 +623,31 @@ class TestSaveSystem:
         farm, player = game_state
         assert SaveSystem.save_game(farm, player)
 
+    def test_saves_stay_in_tmp_path(self, game_state, tmp_path):
+        """Test that tests never read or write the real save file."""
+        assert SaveSystem.SAVE_FILE_PATH != SAVE_FILE
+        assert SaveSystem.save_game(*game_state)
+        assert os.listdir(tmp_path) == ["savegame.json"]
+
+    def test_save_is_compact_unless_pretty(self, game_state, save_file):
+        """Test that gameplay saves are compact and debug saves are indented."""
+        farm, player = game_state
+        assert SaveSystem.save_game(farm, player)
+        with open(save_file) as f:
+            compact = f.read()
+        assert '\n' not in compact and ': ' not in compact
+
+        assert SaveSystem.save_game(farm, player, pretty=True)
+        with open(save_file) as f:
+            pretty = f.read()
+        assert '\n  "farm": {' in pretty
+
+        # Both forms load to the same state
+        loaded_farm, loaded_player, _ = SaveSystem.load_game()
+        assert loaded_farm.get_crop(0, 0).crop_type == 'RADISH'
+        assert loaded_player.coins == 90
+        assert json.loads(compact)['farm'] == json.loads(pretty)['farm']
+
     def test_load_game(self, game_state):
         """Test loading game."""
         farm, player = game_state
@@ -270,24 +661,92 @@ class TestSaveSystem:
         assert loaded_player.coins == 90
         assert loaded_farm.get_crop(0, 0) is not None
 
-    def test_offline_progression(self, game_state):
+    def test_load_rejects_malformed_save(self, game_state, save_file):
+        """Test that a structurally invalid save is rejected before loading."""
+        farm, player = game_state
+        SaveSystem.save_game(farm, player)
+        with open(save_file) as f:
+            data = json.load(f)
+        data['player']['coins'] = "lots"
+        with open(save_file, 'w') as f:
+            json.dump(data, f)
+
+        assert SaveSystem.load_game() is None
+
+    def test_schema_error_messages(self):
+        """Test that schema errors name the offending field."""
+        schema = save_system._SAVE_SCHEMA
+        assert save_system._schema_error([], schema) == "save is not an object"
+        assert save_system._schema_error({'version': 3}, schema) == "missing field last_save"
+
+    def test_serialize_and_write_bytes(self, game_state):
+        """Test the two-step save used by background auto-save."""
+        farm, player = game_state
+        seq, data = SaveSystem.serialize(farm, player)
+        assert isinstance(data, bytes)
+        assert SaveSystem.write_bytes(seq, data)
+
+        loaded_farm, loaded_player, _ = SaveSystem.load_game()
+        assert loaded_player.coins == 90
+        assert loaded_farm.get_crop(0, 0) is not None
+
+    def test_outdated_snapshot_does_not_overwrite_newer_save(self, game_state):
+        """Test that a late auto-save write can't replace the save made on quit."""
+        farm, player = game_state
+        seq, stale = SaveSystem.serialize(farm, player)
+
+        player.add_coins(500)
+        assert SaveSystem.save_game(farm, player)  # Quit save runs first
+        assert not SaveSystem.write_bytes(seq, stale)  # Worker arrives late
+
+        _, loaded_player, _ = SaveSystem.load_game()
+        assert loaded_player.coins == player.coins
+
+    @pytest.mark.skipif(os.name != 'posix', reason="POSIX file modes")
+    def test_save_keeps_file_permissions(self, game_state, save_file):
+        """Test that the temp-file swap doesn't leave the save at mkstemp's 0600."""
+        farm, player = game_state
+        assert SaveSystem.save_game(farm, player)
+        assert os.stat(save_file).st_mode & 0o777 == 0o666 & ~save_system._UMASK
+
+        os.chmod(save_file, 0o640)
+        assert SaveSystem.save_game(farm, player)
+        assert os.stat(save_file).st_mode & 0o777 == 0o640
+
+    def test_failed_save_keeps_previous_file(self, game_state, save_file, monkeypatch):
+        """Test that an error mid-save leaves the old save and no temp file."""
+        farm, player = game_state
+        assert SaveSystem.save_game(farm, player)
+        with open(save_file, 'rb') as f:
+            before = f.read()
+
+        def broken_write_json(self, fp):
+            fp.write('{"width":')
+            raise RuntimeError("disk on fire")
+
+        monkeypatch.setattr(Farm, 'write_json', broken_write_json)
+        assert not SaveSystem.save_game(farm, player)
+
+        with open(save_file, 'rb') as f:
+            assert f.read() == before
+        save_dir = os.path.dirname(save_file)
+        assert not [name for name in os.listdir(save_dir) if name.endswith('.tmp')]
+
+    def test_offline_progression(self, game_state, save_file, past_time):
         """Test offline progression calculation."""
         farm, player = game_state
 
         # Make crop ready by manipulating planted_at
-        crop = farm.get_crop(0, 0)
-        past_time = time.time() - 100  # 100 seconds ago
-        crop.planted_at = past_time
+        farm.get_crop(0, 0).planted_at = past_time
 
         # Save with old timestamp to simulate offline time
         SaveSystem.save_game(farm, player)
 
         # Manually manipulate save file timestamp to simulate 20 seconds offline
-        import json
-        with open(SAVE_FILE, 'r') as f:
+        with open(save_file, 'r') as f:
             data = json.load(f)
         data['last_save'] = time.time() - 20  # 20 seconds ago
-        with open(SAVE_FILE, 'w') as f:
+        with open(save_file, 'w') as f:
             json.dump(data, f)
 
         result = SaveSystem.load_game()
@@ -300,6 +759,21 @@ class TestSaveSystem:
         assert summary['auto_harvested']
         assert summary['total_coins'] > 0
         assert loaded_player.coins > player.coins
+        assert loaded_player.total_crops_harvested == player.total_crops_harvested + 1
+
+    def test_offline_payout_for_backdated_loaded_crop(self, game_state, past_time):
+        """Test that a loaded crop re-timed after planting is paid out at load."""
+        farm, player = game_state
+        loaded_farm = Farm.from_dict(farm.to_dict())
+        loaded_farm.get_crop(0, 0).planted_at = past_time
+        coins = player.coins
+
+        summary = SaveSystem._process_offline_time(loaded_farm, player, time.time() - 20)
+
+        expected = int(CROPS['RADISH'].sell_price * save_system.OFFLINE_REWARD_MULTIPLIER)
+        assert summary['auto_harvested'] == [(CROPS['RADISH'].name, expected)]
+        assert player.coins == coins + expected
+        assert loaded_farm.get_crop(0, 0) is None
 
     def test_create_new_game(self):
         """Test creating a new game."""
@@ -311,21 +785,36 @@ class TestSaveSystem:
         assert player.level == 1
 
 
-@pytest.mark.parametrize("crop_type,expected_growth_time", [
-    ('RADISH', 30),
-    ('CARROT', 60),
-    ('WHEAT', 120),
-    ('TOMATO', 180),
-    ('CORN', 300),
-    ('PUMPKIN', 600),
-])
-def test_crop_configurations(crop_type, expected_growth_time):
+def test_crop_configurations():
     """Test that crop configurations are correct."""
-    config = CROPS[crop_type]
-    assert config.growth_time == expected_growth_time
-    assert config.seed_cost > 0
-    assert config.sell_price > 0
-    assert config.profit >= 0  # Should be profitable
+    assert set(CROPS) == set(EXPECTED_GROWTH_TIMES)
+    for crop_type, config in CROPS.items():
+        assert config.growth_time == EXPECTED_GROWTH_TIMES[crop_type], crop_type
+        assert config.seed_cost > 0, crop_type
+        assert config.sell_price > 0, crop_type
+        assert config.profit >= 0, crop_type  # Should be profitable
+        assert config.profit == config.sell_price - config.seed_cost, crop_type
+
+
+def test_crop_config_is_immutable():
+    """Test that crop configurations cannot be modified at runtime."""
+    config = CROPS['RADISH']
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.sell_price = 999
+
+
+def test_config_is_valid():
+    """Test that the shipped configuration passes static validation."""
+    from tools.validate_config import validate_config
+    assert validate_config()
+
+
+def test_crops_by_unlock_level():
+    """Test that the unlock-level index covers every crop exactly once."""
+    indexed = [crop_type for entries in CROPS_BY_UNLOCK_LEVEL.values() for crop_type, _ in entries]
+    assert sorted(indexed) == sorted(CROPS)
+    for level, entries in CROPS_BY_UNLOCK_LEVEL.items():
+        assert all(config.unlock_level == level for _, config in entries)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Static validation of game configuration.
+
+Runs as a pre-commit hook whenever config.py changes, so the game itself
+does not pay for checking constants on every boot.
+
+Usage:
+    python tools/validate_config.py
+"""
+
+import logging
+import os
+import sys
+
+# Allow running as a script from the repository root or the tools directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (
+    CROPS, XP_PER_LEVEL, XP_PER_HARVEST,
+    AUTO_SAVE_INTERVAL, OFFLINE_REWARD_MULTIPLIER
+)
+
+logger = logging.getLogger(__name__)
+
+
+def validate_config() -> bool:
+    """
+    Validate game configuration for errors.
+
+    Returns:
+        True if configuration is valid, False otherwise
+    """
+    is_valid = True
+
+    # Validate CROPS
+    if not CROPS:
+        logger.error("CROPS configuration is empty")
+        return False
+
+    for crop_key, config in CROPS.items():
+        # Check for negative or zero values
+        if config.growth_time <= 0:
+            logger.error(f"Crop '{crop_key}' has invalid growth_time: {config.growth_time}")
+            is_valid = False
+
+        if config.seed_cost < 0:
+            logger.error(f"Crop '{crop_key}' has negative seed_cost: {config.seed_cost}")
+            is_valid = False
+
+        if config.sell_price < 0:
+            logger.error(f"Crop '{crop_key}' has negative sell_price: {config.sell_price}")
+            is_valid = False
+
+        if config.unlock_level < 1:
+            logger.error(f"Crop '{crop_key}' has invalid unlock_level: {config.unlock_level}")
+            is_valid = False
+
+        # Check for unprofitable crops
+        if config.profit < 0:
+            logger.warning(f"Crop '{crop_key}' is unprofitable (profit: {config.profit})")
+
+    # Validate progression settings
+    if XP_PER_LEVEL <= 0:
+        logger.error(f"XP_PER_LEVEL must be positive: {XP_PER_LEVEL}")
+        is_valid = False
+
+    if XP_PER_HARVEST <= 0:
+        logger.error(f"XP_PER_HARVEST must be positive: {XP_PER_HARVEST}")
+        is_valid = False
+
+    # Validate timing
+    if AUTO_SAVE_INTERVAL <= 0:
+        logger.error(f"AUTO_SAVE_INTERVAL must be positive: {AUTO_SAVE_INTERVAL}")
+        is_valid = False
+
+    if OFFLINE_REWARD_MULTIPLIER < 0 or OFFLINE_REWARD_MULTIPLIER > 1:
+        logger.error(f"OFFLINE_REWARD_MULTIPLIER must be between 0 and 1: {OFFLINE_REWARD_MULTIPLIER}")
+        is_valid = False
+
+    if is_valid:
+        logger.info("Configuration validated successfully")
+    else:
+        logger.error("Configuration validation failed")
+
+    return is_valid
+
+
+def main() -> int:
+    """Entry point. Returns a process exit code."""
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+    return 0 if validate_config() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
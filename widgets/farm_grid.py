@@ -2,7 +2,8 @@
 
 from textual.app import ComposeResult
 from textual.containers import Container, Grid
-from typing import Dict, Tuple, Optional
+from typing import List, Optional
+import time
 
 from widgets.plot import PlotWidget
 from models.farm import Farm
@@ -20,7 +21,8 @@ class FarmGrid(Container):
         """
         super().__init__(**kwargs)
         self.farm = farm
-        self.plots: Dict[Tuple[int, int], PlotWidget] = {}
+        # Row-major like Farm.plots: (x, y) lives at y * width + x
+        self.plots: List[PlotWidget] = []
 
     def compose(self) -> ComposeResult:
         """Create the grid of plots."""
@@ -32,16 +34,31 @@ class FarmGrid(Container):
                 for x in range(self.farm.width):
                     plot = PlotWidget(x, y)
                     plot.crop = self.farm.get_crop(x, y)
-                    self.plots[(x, y)] = plot
+                    self.plots.append(plot)
                     yield plot
 
     def update_all_plots(self) -> None:
-        """Update all plots (called every second by game loop)."""
-        for (x, y), plot in self.plots.items():
-            crop = self.farm.get_crop(x, y)
-            plot.crop = crop
+        """Update plots that may have changed (called every second by game loop)."""
+        self.farm.tick(time.time())  # One clock sample shared by every plot
+        # Empty plots and already-shown ready crops are skipped entirely
+        for x, y in self.farm.get_active_plot_coords():
+            self.update_plot(x, y)
+
+    def update_plot(self, x: int, y: int) -> None:
+        """
+        Update a single plot after its crop was planted or harvested.
+
+        Args:
+            x: X coordinate in farm grid
+            y: Y coordinate in farm grid
+        """
+        plot = self.get_plot(x, y)
+        if plot is not None:
+            plot.crop = self.farm.get_crop(x, y)
             plot.update_display()
 
     def get_plot(self, x: int, y: int) -> Optional[PlotWidget]:
         """Get plot widget at coordinates."""
-        return self.plots.get((x, y))
+        if not (0 <= x < self.farm.width and 0 <= y < self.farm.height):
+            return None
+        return self.plots[y * self.farm.width + x]
@@ -1,13 +1,18 @@
 """Individual farm plot widget."""
 
-from textual.app import ComposeResult
-from textual.containers import Container
-from textual.widgets import Static, Label
+from textual.widgets import Static
 from textual.reactive import reactive
 from textual.message import Message
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
-from models.crop import Crop
+from models.crop import Crop, GrowthStage, STAGE_EMOJI_BY_IDX
+
+# Content of every empty plot
+_EMPTY_RENDER = (
+    "[dim]⬛[/dim]\n"
+    "[dim]Empty[/dim]\n"
+    "[dim]Press Enter[/dim]"
+)
 
 
 class PlotWidget(Static, can_focus=True):
@@ -26,70 +31,93 @@ class PlotWidget(Static, can_focus=True):
         super().__init__(**kwargs)
         self.x = x
         self.y = y
+        self._last_state: Optional[Tuple] = None  # What the last refresh showed
+        # Crop-and-stage specific part of the render, rebuilt on stage change
+        self._header_key: Optional[Tuple[Crop, GrowthStage]] = None
+        self._header = ""
+        self._css_state = ""  # State class currently applied by update_border_color()
+        # Renderer for the current crop, picked once per crop change by watch_crop()
+        self._render_content: Callable[[], str] = self._render_empty
         self.add_class("plot")
 
     def render(self) -> str:
         """Render the plot content."""
-        if self.crop is None:
-            return self._render_empty()
-        else:
-            return self._render_crop()
+        return self._render_content()
 
     def _render_empty(self) -> str:
         """Render an empty plot."""
-        return (
-            "[dim]⬛[/dim]\n"
-            "[dim]Empty[/dim]\n"
-            "[dim]Press Enter[/dim]"
-        )
+        return _EMPTY_RENDER
 
     def _render_crop(self) -> str:
         """Render a growing or ready crop."""
         crop = self.crop
-        emoji = crop.config.emoji
-        stage_emoji = crop.stage_emoji
-        progress_bar = crop.progress_bar
-        time_remaining = crop.time_remaining
-
-        # Combine crop emoji with stage emoji
-        display_emoji = f"{emoji}{stage_emoji}"
+        stage = crop.current_stage
+        ready = stage is GrowthStage.READY
+
+        key = (crop, stage)
+        if key != self._header_key:
+            self._header_key = key
+            # Combine crop emoji with stage emoji
+            display_emoji = f"{crop.emoji}{STAGE_EMOJI_BY_IDX[stage]}"
+            if ready:
+                self._header = (
+                    f"[green bold]{display_emoji}[/green bold]\n"
+                    f"[green]{crop.name}[/green]\n"
+                    f"[green bold]READY![/green bold]"
+                )
+            else:
+                self._header = f"{display_emoji}\n"
+
+        if ready:
+            return self._header
+        # Only the bar and countdown change between stages
+        return (
+            f"{self._header}"
+            f"[yellow]{crop.progress_bar}[/yellow]\n"
+            f"[dim]{crop.time_remaining}[/dim]"
+        )
 
+    def _display_state(self) -> Optional[Tuple]:
+        """Everything render() depends on; equal states render identically."""
+        crop = self.crop
+        if crop is None:
+            return None
         if crop.is_ready:
-            return (
-                f"[green bold]{display_emoji}[/green bold]\n"
-                f"[green]{crop.config.name}[/green]\n"
-                f"[green bold]READY![/green bold]"
-            )
-        else:
-            return (
-                f"{display_emoji}\n"
-                f"[yellow]{progress_bar}[/yellow]\n"
-                f"[dim]{time_remaining}[/dim]"
-            )
+            return (crop, True)
+        return (crop, False, crop.current_stage, crop.progress_bar, crop.time_remaining)
 
     def watch_crop(self, old_crop: Optional[Crop], new_crop: Optional[Crop]) -> None:
         """React to crop changes."""
+        self._render_content = self._render_empty if new_crop is None else self._render_crop
+        self._last_state = self._display_state()
         self.update_border_color()
         self.refresh()
 
     def update_border_color(self) -> None:
-        """Update border color based on crop state."""
-        # Remove all state classes
-        self.remove_class("empty")
-        self.remove_class("growing")
-        self.remove_class("ready")
-
-        if self.crop is None:
-            self.add_class("empty")
-        elif self.crop.is_ready:
-            self.add_class("ready")
+        """Update border color based on crop state, touching classes only on change."""
+        crop = self.crop
+        if crop is None:
+            new_state = "empty"
+        elif crop.is_ready:
+            new_state = "ready"
         else:
-            self.add_class("growing")
+            new_state = "growing"
+
+        if new_state == self._css_state:
+            return
+        if self._css_state:
+            self.remove_class(self._css_state)
+        self.add_class(new_state)
+        self._css_state = new_state
 
     def update_display(self) -> None:
-        """Refresh the display (called periodically)."""
-        if self.crop is not None:
-            self.watch_crop(self.crop, self.crop)
+        """Refresh the display (called periodically), skipping unchanged plots."""
+        state = self._display_state()
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.update_border_color()
+        self.refresh()
 
     async def on_click(self) -> None:
         """Handle click on plot."""
@@ -4,18 +4,31 @@ from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import Static
 from textual.reactive import reactive
+from typing import Tuple
 
 from models.player import Player
 
+# Every 20-cell XP bar, indexed by filled cells (0-20)
+_XP_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Static help block appended to every stats render
+_CONTROLS_TEXT = (
+    "[dim]─────────────────[/dim]\n"
+    "[bold]Controls:[/bold]\n"
+    "[dim]hjkl/Arrows - Navigate[/dim]\n"
+    "[dim]Enter/Space - Select[/dim]\n"
+    "[dim]Esc - Cancel[/dim]\n"
+    "[dim]? - Help | S - Shop[/dim]\n"
+    "[dim]Q - Quit[/dim]\n"
+)
+
 
 class Sidebar(Container):
     """Displays player resources and stats."""
 
-    coins = reactive(0)
-    level = reactive(1)
-    experience = reactive(0)
-    xp_for_next = reactive(100)
-    ready_count = reactive(0)
+    # (coins, level, experience, xp_for_next, ready_count), assigned as a
+    # whole so any number of changed fields triggers a single render
+    state: reactive[Tuple[int, int, int, int, int]] = reactive((0, 1, 0, 100, 0))
 
     def compose(self) -> ComposeResult:
         """Create sidebar content."""
@@ -23,44 +36,27 @@ class Sidebar(Container):
 
     def render_stats(self) -> str:
         """Render stats content."""
-        xp_progress = int((self.experience / self.xp_for_next) * 20) if self.xp_for_next > 0 else 0
-        xp_bar = "█" * xp_progress + "░" * (20 - xp_progress)
+        coins, level, experience, xp_for_next, ready_count = self.state
+        xp_progress = int((experience / xp_for_next) * 20) if xp_for_next > 0 else 0
+        xp_bar = _XP_BARS[min(20, xp_progress)]
 
         return (
-            f"[bold cyan]💰 Coins:[/bold cyan] {self.coins}\n"
-            f"[bold yellow]⭐ Level:[/bold yellow] {self.level}\n"
-            f"[bold magenta]XP:[/bold magenta] {self.experience}/{self.xp_for_next}\n"
+            f"[bold cyan]💰 Coins:[/bold cyan] {coins}\n"
+            f"[bold yellow]⭐ Level:[/bold yellow] {level}\n"
+            f"[bold magenta]XP:[/bold magenta] {experience}/{xp_for_next}\n"
             f"[yellow]{xp_bar}[/yellow]\n"
             f"\n"
-            f"[bold green]✨ Ready:[/bold green] {self.ready_count}\n"
+            f"[bold green]✨ Ready:[/bold green] {ready_count}\n"
             f"\n"
-            f"[dim]─────────────────[/dim]\n"
-            f"[bold]Controls:[/bold]\n"
-            f"[dim]hjkl/Arrows - Navigate[/dim]\n"
-            f"[dim]Enter/Space - Select[/dim]\n"
-            f"[dim]Esc - Cancel[/dim]\n"
-            f"[dim]? - Help | S - Shop[/dim]\n"
-            f"[dim]Q - Quit[/dim]\n"
+            f"{_CONTROLS_TEXT}"
         )
 
-    def watch_coins(self, old_value: int, new_value: int) -> None:
-        """Update display when coins change."""
-        self._update_display()
-
-    def watch_level(self, old_value: int, new_value: int) -> None:
-        """Update display when level changes."""
-        self._update_display()
-
-    def watch_experience(self, old_value: int, new_value: int) -> None:
-        """Update display when XP changes."""
-        self._update_display()
-
-    def watch_xp_for_next(self, old_value: int, new_value: int) -> None:
-        """Update display when XP requirement changes."""
-        self._update_display()
-
-    def watch_ready_count(self, old_value: int, new_value: int) -> None:
-        """Update display when ready count changes."""
+    def watch_state(
+        self,
+        old_state: Tuple[int, int, int, int, int],
+        new_state: Tuple[int, int, int, int, int]
+    ) -> None:
+        """Update display when any stat changes."""
         self._update_display()
 
     def _update_display(self) -> None:
@@ -76,8 +72,10 @@ class Sidebar(Container):
             player: Player object
             ready_count: Number of ready crops
         """
-        self.coins = player.coins
-        self.level = player.level
-        self.experience = player.experience
-        self.xp_for_next = player.xp_for_next_level
-        self.ready_count = ready_count
+        self.state = (
+            player.coins,
+            player.level,
+            player.experience,
+            player.xp_for_next_level,
+            ready_count,
+        )